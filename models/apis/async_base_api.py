@@ -0,0 +1,112 @@
+# api_models/async_base_api.py
+from __future__ import annotations
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from models.apis.base_api import BaseAPI
+from utils.http_sessions import POOL_MAXSIZE
+
+# Requests in flight per client. Matches the connection pool size by
+# default, so every concurrent request can keep its connection alive.
+MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", POOL_MAXSIZE))
+
+class AsyncBaseAPI(BaseAPI):
+    """Awaitable sibling of BaseAPI for fanning out many requests at once.
+
+    `get()` and `post()` return coroutines. Requests run on a thread pool
+    through the same pooled session as BaseAPI, so no extra HTTP library
+    is needed, and at most `max_concurrency` of them are in flight.
+
+    API models can reuse their sync endpoint methods by listing this
+    class first, as those methods simply return what `get()`/`post()`
+    return. See AsyncPostmanEchoAPI. Streaming is the exception: reading
+    a body piece by piece would block the event loop, so `stream()`
+    raises and streamed endpoints need the sync client.
+
+    Usage example:
+        async with AsyncPostmanEchoAPI() as api:
+            responses = await api.map(api.echo_get, [{"a": 1}, {"a": 2}])
+
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        max_concurrency: int = MAX_CONCURRENCY
+    ):
+        """Initialize the client and its concurrency limit."""
+        super().__init__(base_url)
+        self.max_concurrency = max(max_concurrency, 1)
+        self._semaphore = None
+        self._loop = None
+        self._executor = None
+
+    async def get(self, path: str, **kwargs):
+        """Send a GET request to the specified path."""
+        return await self._run(self._request, "GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        """Send a POST request to the specified path."""
+        return await self._run(self._request, "POST", path, **kwargs)
+
+    def stream(self, method: str, path: str, **kwargs):
+        """Not supported, use the sync BaseAPI client to stream."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} can't stream responses without "
+            "blocking the event loop. Use the sync client instead."
+        )
+
+    async def gather(self, *requests):
+        """Await many requests, returning responses in the same order.
+
+        Args:
+            *requests: Coroutines from this client, e.g. `api.get(...)`.
+
+        """
+        return await asyncio.gather(*requests)
+
+    async def map(self, request, items):
+        """Send one request per item, with the concurrency limit applied.
+
+        Args:
+            request (callable): Endpoint method taking a single item,
+                e.g. `api.echo_get`.
+            items (iterable): The arguments to call it with.
+
+        Returns:
+            list: The responses, in the order of `items`.
+
+        """
+        return await self.gather(*(request(item) for item in items))
+
+    def close(self):
+        """Shut down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking call on the worker threads within the limit."""
+        loop = asyncio.get_running_loop()
+        # Semaphores belong to one event loop, e.g. one asyncio.run()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="api-client"
+            )
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs)
+            )
@@ -2,24 +2,70 @@
 from __future__ import annotations
 import requests
 
+from utils.cassette import get_cassette
+from utils.http_sessions import api_sessions
+from utils.streaming import StreamedResponse
+
 class BaseAPI:
     """Base class for API interactions using requests.Session."""
-    
+
     BASE_URL: str = ""
 
-    def __init__(self):
-        """Initialize the BaseAPI with a requests session."""
-        self.session = requests.Session()
+    def __init__(self, base_url: str | None = None):
+        """Initialize the BaseAPI with the shared session for its base URL.
+
+        Connections are pooled and kept alive across every client of the
+        same service, see utils/http_sessions.py.
+
+        Args:
+            base_url (str): Optional URL to use instead of BASE_URL, e.g.
+                a local stand-in server.
+
+        """
+        self.base_url = base_url or self.BASE_URL
+        self.session = api_sessions.get(self.base_url)
+        self.auth = None
 
     def get(self, path: str, **kwargs):
         """Send a GET request to the specified path."""
-        return self.session.get(self.BASE_URL + path, **kwargs)
+        return self._request("GET", path, **kwargs)
 
     def post(self, path: str, **kwargs):
         """Send a POST request to the specified path."""
-        return self.session.post(self.BASE_URL + path, **kwargs)
+        return self._request("POST", path, **kwargs)
+
+    def stream(self, method: str, path: str, **kwargs) -> StreamedResponse:
+        """Send a request and read its body incrementally.
+
+        Use for large responses, see utils/streaming.py. The status and
+        headers are available right away; the body is only downloaded as
+        the returned object is iterated.
+        """
+        return StreamedResponse(
+            self._request(method, path, stream=True, **kwargs)
+        )
 
     def with_auth(self, username: str, password: str):
-        """Set HTTP Basic Auth for the session."""
-        self.session.auth = requests.auth.HTTPBasicAuth(username, password)
-        return self
\ No newline at end of file
+        """Set HTTP Basic Auth for this client's requests.
+
+        Stored on the client rather than the shared session, so other
+        clients of the same service stay unauthenticated.
+        """
+        self.auth = requests.auth.HTTPBasicAuth(username, password)
+        return self
+
+    def _request(self, method: str, path: str, **kwargs):
+        """Send a request through the shared session.
+
+        Every request goes through here, so this is also where recorded
+        responses are replayed when API_CASSETTE_MODE is set. Streamed
+        requests always go to the network, as recording them would read
+        the whole body into memory.
+        """
+        if self.auth is not None:
+            kwargs.setdefault("auth", self.auth)
+        url = self.base_url + path
+        cassette = get_cassette(self.base_url)
+        if cassette is not None and not kwargs.get("stream"):
+            return cassette.request(self.session, method, url, **kwargs)
+        return self.session.request(method, url, **kwargs)
@@ -1,5 +1,6 @@
 # api_models/postman_echo.py
 from __future__ import annotations
+from models.apis.async_base_api import AsyncBaseAPI
 from models.apis.base_api import BaseAPI
 
 class PostmanEchoAPI(BaseAPI):
@@ -21,9 +22,24 @@ class PostmanEchoAPI(BaseAPI):
         """
         return self.post("/post", json=payload)
 
+    def echo_stream(self, count: int, params: dict | None = None):
+        """Stream a GET request from the /stream/<count> endpoint.
+
+        The response body holds `count` JSON objects, one per line.
+        """
+        return self.stream("GET", f"/stream/{count}", params=params)
+
     def basic_auth(self):
         """Send GET request to the /basic-auth endpoint.
         
         Requires Basic Authentication credentials to be set in the session.
         """
         return self.get("/basic-auth")
+
+class AsyncPostmanEchoAPI(AsyncBaseAPI, PostmanEchoAPI):
+    """Async client for the same Postman Echo endpoints.
+
+    Every endpoint method returns a coroutine, e.g.
+    `await api.echo_get(params)`, except `echo_stream()`, which is only
+    available on PostmanEchoAPI.
+    """
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from models.pages.element_cache import ElementCache
+from models.pages.readiness import READINESS_SCRIPT, describe_readiness
+from models.pages.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
+from utils.locators import to_js_locator
+from utils.logging import events
+from utils.resource_blocking import apply_blocklist, global_blocklist
 from utils.timing import Timing
 from utils.dom import save_dom_on_failure
 
@@ -21,11 +28,40 @@ class BasePage:
     # by page models that inherit this class
     LOCATORS = {}
 
+    # READY_LOCATORS are names from LOCATORS that must be displayed
+    # before the page counts as loaded
+    READY_LOCATORS = ()
+
+    # READY_STATE is the minimum document.readyState for a loaded page
+    # ("loading", "interactive" or "complete"), or None to skip the check
+    READY_STATE = "interactive"
+
+    # BLOCKED_URLS are URL patterns ("*" matches anything) the browser
+    # skips while this page loads, on top of the .env BLOCK_RESOURCES and
+    # BLOCKED_URLS. Chrome and Edge only.
+    BLOCKED_URLS = ()
+
     def __init__(self, driver: WebDriver):
         self.driver = driver
+        self.element_cache = ElementCache()
     
+    def get_locator(self, name: str):
+        """Get a locator tuple from LOCATORS by name
+
+        Raises:
+            ValueError: If the locator is not found in LOCATORS.
+
+        """
+        locator = self.LOCATORS.get(name)
+        if locator is None:
+            raise ValueError(f"Locator '{name}' not found in LOCATORS.")
+        return locator
+
     def get_element(self, name: str):
         """Get an element using Selenium
+
+        Elements are cached per page, and only looked up again after the
+        page navigates or the element goes stale.
         
         Args:
             name (str): The key for the locator in the LOCATORS dict.
@@ -35,40 +71,106 @@ class BasePage:
 
         Raises:
             ValueError: If the locator is not found in LOCATORS.
+            NoSuchElementException: If the element is not on the page.
 
         """
-        locator = self.LOCATORS.get(name)
-        if locator is None:
-            raise ValueError(f"Locator '{name}' not found in LOCATORS.")
-        return self.driver.find_element(*locator)
+        return self.element_cache.get(
+            self.driver, name, self.get_locator(name)
+        )
+
+    def get_elements(self, *names: str):
+        """Get several elements with a single WebDriver call
+
+        Args:
+            *names (str): Keys for locators in the LOCATORS dict.
+                Defaults to every locator on the page.
+
+        Returns:
+            dict[str, WebElement]: The found web elements by name.
+
+        Raises:
+            ValueError: If a locator is not found in LOCATORS.
+            NoSuchElementException: If any element is not on the page.
+
+        """
+        snapshot = self.snapshot(*names)
+        missing = snapshot.missing()
+        if missing:
+            raise NoSuchElementException(
+                f"Elements not found on {self.__class__.__name__}: {missing}"
+            )
+        return {element.name: element.element for element in snapshot}
+
+    def snapshot(self, *names: str) -> PageSnapshot:
+        """Capture elements and their state with a single WebDriver call
+
+        Resolves the locators, visibility, text and attributes together in
+        the browser rather than spending a round-trip on each of them.
+
+        Args:
+            *names (str): Keys for locators in the LOCATORS dict.
+                Defaults to every locator on the page.
+
+        Returns:
+            PageSnapshot: Read-only element details keyed by locator name.
+
+        Raises:
+            ValueError: If a locator is not found in LOCATORS.
+
+        """
+        locators = {
+            name: to_js_locator(*self.get_locator(name))
+            for name in (names or self.LOCATORS)
+        }
+        results = self.driver.execute_script(SNAPSHOT_SCRIPT, locators)
+        snapshot = PageSnapshot(results["elements"], results["document_id"])
+
+        # Found elements are fresh, so later get_element() calls can use them
+        for element in snapshot:
+            if element.exists:
+                self.element_cache.store(
+                    self.driver,
+                    element.name,
+                    self.get_locator(element.name),
+                    element.element,
+                    snapshot.document_id
+                )
+        return snapshot
     
     @save_dom_on_failure(
         lambda self: f"{self.__class__.__name__}_is_loaded_failed.html"
     )
     def is_loaded(self, timeout: float = 10.0):
-        """Wait until the page is finished loading by checking URL and title.
+        """Wait until the page is finished loading.
+
+        Checks every ready condition the page declares (URL, TITLE,
+        READY_STATE and READY_LOCATORS) together, with one script per poll.
 
-        Raises AssertionError with debug artifacts if the condition fails.
+        Raises TimeoutError with debug artifacts if the conditions fail.
         """
-        if self.URL is not None:
-            Timing.wait_until_true(
-                lambda: self.URL in self.driver.current_url,
-                timeout=timeout,
-                message=(
-                    f"Expected URL to contain '{self.URL}' "
-                    f"but got '{self.driver.current_url}'"
-                )
+        expected = {
+            "url": self.URL,
+            "title": self.TITLE,
+            "ready_state": self.READY_STATE,
+            "locators": {
+                name: to_js_locator(*self.get_locator(name))
+                for name in self.READY_LOCATORS
+            },
+        }
+        state = {}
+
+        def check():
+            state.clear()
+            state.update(
+                self.driver.execute_script(READINESS_SCRIPT, expected)
             )
+            return state["ready"]
 
-        if self.TITLE is not None:
-            Timing.wait_until_true(
-                lambda: self.TITLE in self.driver.title,
-                timeout=timeout,
-                message=(
-                    f"Expected title to contain '{self.TITLE}' "
-                    f"but got '{self.driver.title}'"
-                )
-            )
+        Timing.wait_until_true(
+            check,
+            timeout=timeout,
+            message=lambda: describe_readiness(self, state, timeout)
+        )
 
         return True
 
@@ -81,5 +183,11 @@ class BasePage:
         """
         if not self.URL:
             raise NotImplementedError("Page model failed to define a URL.")
-        self.driver.get(self.URL)
-        self.is_loaded()
+        apply_blocklist(
+            self.driver,
+            global_blocklist() + list(self.BLOCKED_URLS)
+        )
+        self.element_cache.invalidate()
+        with events.timed("page_load", page=self.__class__.__name__):
+            self.driver.get(self.URL)
+            self.is_loaded()
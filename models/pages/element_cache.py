@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.locators import JS_HELPERS, to_js_locator
+
+# Also reports the document id, which tells a navigation apart from a
+# lookup on the same page
+FIND_SCRIPT = JS_HELPERS + """
+return [__documentId(), __find(arguments[0])];
+"""
+
+
+class CachedElement(WebElement):
+    """WebElement that looks itself up again once it goes stale.
+
+    Lets a cache hit skip the browser entirely: an element that was
+    re-rendered or lost to a navigation raises
+    StaleElementReferenceException on its next command, which is answered
+    by a single lookup of its locator and a retry of that command.
+    """
+
+    def __init__(self, element: WebElement, refind):
+        super().__init__(element.parent, element.id)
+        self._refind = refind
+
+    def get_attribute(self, name: str):
+        """Get an attribute or property, see WebElement.get_attribute"""
+        return self._retry_if_stale(super().get_attribute, name)
+
+    def is_displayed(self) -> bool:
+        """Check whether the element is visible to a user"""
+        return self._retry_if_stale(super().is_displayed)
+
+    def _execute(self, command, params=None):
+        return self._retry_if_stale(super()._execute, command, params)
+
+    def _retry_if_stale(self, method, *args):
+        try:
+            return method(*args)
+        except StaleElementReferenceException:
+            self._id = self._refind().id
+            return method(*args)
+
+
+class CacheStats:
+    """Hit and miss counters for element lookups"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def summary(self) -> str:
+        """Describe the counters in a single log-friendly line"""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0
+        return (
+            f"{lookups} lookups, {self.hits} hits ({rate:.0f}%), "
+            f"{self.misses} misses, {self.stale} stale"
+        )
+
+
+class ElementCache:
+    """Per-page cache of WebElements keyed by locator name.
+
+    A cache hit returns the stored element without asking the browser.
+    Elements are validated lazily instead: entries from an older document
+    are dropped as soon as a lookup or snapshot reports a new document id,
+    and an element that turns out to be stale when used re-resolves its
+    locator and retries (see CachedElement).
+
+    Usage example:
+        cache = ElementCache()
+        element = cache.get(driver, "search_box", (By.ID, "search"))
+
+    """
+
+    # Counters across every page in this process
+    totals = CacheStats()
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._entries = {}
+        self._document_id = None
+
+    def get(self, driver, name: str, locator: tuple):
+        """Get the cached element, or look it up on a miss.
+
+        Args:
+            driver: The Selenium WebDriver instance.
+            name (str): The locator name, used as the cache key.
+            locator (tuple): The (By, value) locator.
+
+        Returns:
+            WebElement: The found web element.
+
+        Raises:
+            NoSuchElementException: If the element is not on the page.
+
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            self._count("hits")
+            return entry[0]
+
+        self._count("misses")
+        element, document_id = self._find(driver, name, locator)
+        return self.store(driver, name, locator, element, document_id)
+
+    def store(
+        self,
+        driver,
+        name: str,
+        locator: tuple,
+        element: WebElement,
+        document_id: str
+    ) -> CachedElement:
+        """Add an element that was resolved elsewhere, e.g. by a snapshot"""
+        self._observe(document_id)
+        cached = CachedElement(
+            element, lambda: self._refind(driver, name, locator, cached)
+        )
+        self._entries[name] = (cached, document_id)
+        return cached
+
+    def invalidate(self, name: str | None = None):
+        """Forget one cached element, or all of them"""
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+    def _find(self, driver, name: str, locator: tuple):
+        document_id, element = driver.execute_script(
+            FIND_SCRIPT, to_js_locator(*locator)
+        )
+        self._observe(document_id)
+        if element is None:
+            self._entries.pop(name, None)
+            raise NoSuchElementException(
+                f"Unable to locate element '{name}': {locator}"
+            )
+        return element, document_id
+
+    def _refind(self, driver, name: str, locator: tuple, cached):
+        """Resolve a stale element again, keeping the caller's object"""
+        self._count("stale")
+        element, document_id = self._find(driver, name, locator)
+        self._entries[name] = (cached, document_id)
+        return element
+
+    def _observe(self, document_id: str):
+        """Drop every entry found before the page navigated"""
+        if document_id == self._document_id:
+            return
+        self._document_id = document_id
+        self._entries = {
+            name: entry
+            for name, entry in self._entries.items()
+            if entry[1] == document_id
+        }
+
+    def _count(self, counter: str):
+        setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+        setattr(self.totals, counter, getattr(self.totals, counter) + 1)
@@ -2,8 +2,6 @@ from __future__ import annotations
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from models.pages.base_page import BasePage
-from utils.timing import Timing
-from utils.dom import save_dom_on_failure
 
 class NYCraigslistHomePage(BasePage):
     """Page object model for the NY Craigslist home page"""
@@ -18,18 +16,9 @@ class NYCraigslistHomePage(BasePage):
             "//input[@placeholder = 'search craigslist']"
         )
     }
-
-    @save_dom_on_failure(
-        lambda self: f"{self.__class__.__name__}_is_loaded_failed.html"
-    )
-    def is_loaded(self):
-        """Check required elements have loaded"""
-        super().is_loaded() # Inherit checks from BasePage
-        
-        Timing.wait_until_true(
-            lambda: self.get_element("search_box").is_displayed(),
-            message="Search box is not displayed on the Craigslist home page."
-        )
+    READY_LOCATORS = ("search_box",)
+    # Listing thumbnails aren't needed to search
+    BLOCKED_URLS = ("*images.craigslist.org*",)
 
     def search(self, query: str):
         """Type into the search box and submit it"""
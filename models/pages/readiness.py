@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from utils.locators import JS_HELPERS
+
+# Evaluates every ready condition a page declares in one round-trip
+READINESS_SCRIPT = JS_HELPERS + """
+var expected = arguments[0];
+var states = ['loading', 'interactive', 'complete'];
+var state = {
+    url: window.location.href,
+    title: document.title,
+    ready_state: document.readyState,
+    failed: [],
+    missing: []
+};
+if (expected.url !== null && state.url.indexOf(expected.url) === -1) {
+    state.failed.push('url');
+}
+if (expected.title !== null && state.title.indexOf(expected.title) === -1) {
+    state.failed.push('title');
+}
+if (expected.ready_state !== null && states.indexOf(state.ready_state)
+        < states.indexOf(expected.ready_state)) {
+    state.failed.push('ready_state');
+}
+for (var name in expected.locators) {
+    if (!__isDisplayed(__find(expected.locators[name]))) {
+        state.missing.push(name);
+    }
+}
+state.ready = state.failed.length === 0 && state.missing.length === 0;
+return state;
+"""
+
+
+def describe_readiness(page, state: dict, timeout: float) -> str:
+    """Explain which ready conditions a page failed, for error messages"""
+    if not state:
+        return (
+            f"{page.__class__.__name__} readiness could not be checked "
+            f"within {timeout} seconds"
+        )
+
+    reasons = []
+    if "url" in state["failed"]:
+        reasons.append(
+            f"Expected URL to contain '{page.URL}' "
+            f"but got '{state['url']}'"
+        )
+    if "title" in state["failed"]:
+        reasons.append(
+            f"Expected title to contain '{page.TITLE}' "
+            f"but got '{state['title']}'"
+        )
+    if "ready_state" in state["failed"]:
+        reasons.append(
+            f"Expected document.readyState '{page.READY_STATE}' "
+            f"but got '{state['ready_state']}'"
+        )
+    if state["missing"]:
+        reasons.append(f"Elements not displayed: {state['missing']}")
+
+    return (
+        f"{page.__class__.__name__} did not load within {timeout} seconds: "
+        + "; ".join(reasons)
+    )
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from utils.locators import JS_HELPERS
+
+# Resolves every requested locator in one round-trip. Each entry comes
+# back as null (not found) or the element with the details tests and
+# readiness checks usually ask Selenium for one call at a time.
+SNAPSHOT_SCRIPT = JS_HELPERS + """
+var locators = arguments[0];
+var results = {};
+for (var name in locators) {
+    var el = __find(locators[name]);
+    if (!el) {
+        results[name] = null;
+        continue;
+    }
+    var attributes = {};
+    for (var i = 0; i < el.attributes.length; i++) {
+        attributes[el.attributes[i].name] = el.attributes[i].value;
+    }
+    var displayed = __isDisplayed(el);
+    results[name] = {
+        element: el,
+        tag_name: el.tagName.toLowerCase(),
+        displayed: displayed,
+        enabled: __isEnabled(el),
+        text: displayed ? (el.innerText ?? el.textContent ?? '').trim() : '',
+        value: el.value === undefined ? null : el.value,
+        attributes: attributes
+    };
+}
+return {document_id: __documentId(), elements: results};
+"""
+
+
+class ElementSnapshot:
+    """Point-in-time details of one element from a PageSnapshot.
+
+    Reading these attributes never talks to the browser. Use `element`
+    when the test needs to interact with the live WebElement.
+    """
+
+    def __init__(self, name: str, data: dict | None):
+        data = data or {}
+        self.name = name
+        self.exists = bool(data)
+        self.element = data.get("element")
+        self.tag_name = data.get("tag_name")
+        self.displayed = data.get("displayed", False)
+        self.enabled = data.get("enabled", False)
+        self.text = data.get("text", "")
+        self.value = data.get("value")
+        self.attributes = data.get("attributes", {})
+
+    def get_attribute(self, name: str):
+        """Get an HTML attribute value as it was when the snapshot ran"""
+        return self.attributes.get(name)
+
+    def __repr__(self):
+        return (
+            f"ElementSnapshot({self.name!r}, exists={self.exists}, "
+            f"displayed={self.displayed}, text={self.text!r})"
+        )
+
+
+class PageSnapshot:
+    """Lightweight, read-only view of many page elements at once.
+
+    Created by `BasePage.snapshot()` from a single script call, instead of
+    one WebDriver round-trip per element and per property.
+    """
+
+    def __init__(self, results: dict, document_id: str | None = None):
+        self.document_id = document_id
+        self._elements = {
+            name: ElementSnapshot(name, data)
+            for name, data in results.items()
+        }
+
+    def __getitem__(self, name: str) -> ElementSnapshot:
+        return self._elements[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._elements
+
+    def __iter__(self):
+        return iter(self._elements.values())
+
+    @property
+    def names(self) -> list[str]:
+        """Get the locator names included in this snapshot"""
+        return list(self._elements)
+
+    def exists(self, name: str) -> bool:
+        """Check whether the element was found"""
+        return self._elements[name].exists
+
+    def is_displayed(self, name: str) -> bool:
+        """Check whether the element was found and visible"""
+        return self._elements[name].displayed
+
+    def missing(self) -> list[str]:
+        """Get the names of all elements that were not found"""
+        return [name for name, el in self._elements.items() if not el.exists]
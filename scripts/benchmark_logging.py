@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import sys
+import time
+
+from utils.logging import DATE_FORMAT, LOG_COLORS, LogFormatter
+
+
+class LegacyLogFormatter(logging.Formatter):
+    """The LogFormatter implementation before it was optimized.
+
+    Kept here only as the baseline for this benchmark.
+    """
+
+    colors = LOG_COLORS
+
+    def __init__(self, color=False):
+        super().__init__(fmt="%(asctime)s", datefmt=DATE_FORMAT)
+        self.color = color
+
+    def format(self, log):
+        """Format the log record with colors and structured output."""
+        super().format(log)
+
+        level_color = (
+            self.colors.get(log.levelname, self.colors['RESET'])
+            if self.color else ''
+        )
+        time_color = self.colors['TIMESTAMP'] if self.color else ''
+        file_color = self.colors['RESET'] if self.color else ''
+        reset = self.colors['RESET'] if self.color else ''
+
+        time_string = f"{time_color}[{log.asctime}]"
+        level_string = f"{level_color}[{log.levelname}]"
+        file_line_string = f"{file_color}[{log.filename}:{log.lineno}]"
+        message_string = f"{level_color}{log.getMessage()}"
+
+        return (
+            f"{level_string}"
+            f"{time_string}"
+            f"{file_line_string}"
+            f" {message_string}"
+            f"{reset}"
+        )
+
+
+def _make_records(count: int) -> list[logging.LogRecord]:
+    """Create records spread over a few seconds and all log levels"""
+    levels = [
+        logging.DEBUG, logging.INFO, logging.WARNING,
+        logging.ERROR, logging.CRITICAL
+    ]
+    start = time.time()
+    records = []
+    for i in range(count):
+        record = logging.LogRecord(
+            name="benchmark",
+            level=levels[i % len(levels)],
+            pathname="tests/examples/test_example_logging.py",
+            lineno=i % 500,
+            msg="Benchmark message %d with an argument",
+            args=(i,),
+            exc_info=None,
+        )
+        # About 1000 records per second of log time
+        record.created = start + i / 1000
+        records.append(record)
+    return records
+
+
+def _time_formatter(formatter, records) -> float:
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return time.perf_counter() - start
+
+
+def benchmark_logging():
+    """Compare LogFormatter against the legacy implementation
+
+    Usage: poetry run benchmark_logging [RECORD_COUNT]
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records = _make_records(count)
+
+    for color in (False, True):
+        legacy = LegacyLogFormatter(color=color)
+        current = LogFormatter(color=color)
+
+        # Both must produce identical output for the comparison to be fair
+        for record in records[:1000]:
+            assert legacy.format(record) == current.format(record)
+
+        legacy_seconds = _time_formatter(legacy, records)
+        current_seconds = _time_formatter(current, records)
+        print(
+            f"color={color}: {count:,} records\n"
+            f"  legacy:  {legacy_seconds:.2f}s "
+            f"({count / legacy_seconds:,.0f} records/s)\n"
+            f"  current: {current_seconds:.2f}s "
+            f"({count / current_seconds:,.0f} records/s)\n"
+            f"  speedup: {legacy_seconds / current_seconds:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_logging()
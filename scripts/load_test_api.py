@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utils.echo_server import EchoServer
+
+
+def _report(name: str, latencies: list[float], errors: int, seconds: float):
+    """Print throughput and latency percentiles for one client"""
+    total = len(latencies) + errors
+    print(
+        f"{name}: {total:,} requests in {seconds:.2f}s, {errors} errors\n"
+        f"  throughput: {len(latencies) / seconds:,.0f} requests/s"
+    )
+    if len(latencies) < 2:
+        # Percentiles need at least two successful requests
+        if latencies:
+            print(f"  latency:    {latencies[0] * 1000:.1f} ms")
+        return
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"  latency:    p50 {percentiles[49] * 1000:.1f} ms, "
+        f"p95 {percentiles[94] * 1000:.1f} ms, "
+        f"p99 {percentiles[98] * 1000:.1f} ms"
+    )
+
+
+def _timed_request(api, index: int):
+    """Send one request, returning its latency and status, or None"""
+    started = time.perf_counter()
+    try:
+        response = api.echo_get({"request": str(index)})
+    except requests.RequestException:
+        return time.perf_counter() - started, None
+    return time.perf_counter() - started, response.status_code
+
+
+def _run_sync(base_url: str, count: int, concurrency: int):
+    from models.apis.examples.postman_api import PostmanEchoAPI
+
+    api = PostmanEchoAPI(base_url=base_url)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(
+            lambda index: _timed_request(api, index), range(count)
+        ))
+    return results, time.perf_counter() - started
+
+
+def _run_async(base_url: str, count: int, concurrency: int):
+    from models.apis.examples.postman_api import AsyncPostmanEchoAPI
+
+    async def timed_request(api, index: int):
+        started = time.perf_counter()
+        try:
+            response = await api.echo_get({"request": str(index)})
+        except requests.RequestException:
+            return time.perf_counter() - started, None
+        return time.perf_counter() - started, response.status_code
+
+    async def worker(api, indexes):
+        return [await timed_request(api, index) for index in indexes]
+
+    async def run():
+        # Keep exactly `concurrency` requests in flight, so latencies
+        # don't include time spent queued behind the concurrency limit
+        indexes = iter(range(count))
+        async with AsyncPostmanEchoAPI(
+            base_url=base_url, max_concurrency=concurrency
+        ) as api:
+            batches = await api.gather(
+                *(worker(api, indexes) for _ in range(concurrency))
+            )
+        return [result for batch in batches for result in batch]
+
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    return results, time.perf_counter() - started
+
+
+def load_test_api():
+    """Load test BaseAPI and AsyncBaseAPI against an echo server
+
+    Starts the local echo server unless a base URL is given.
+
+    Usage: poetry run load_test_api [REQUEST_COUNT] [CONCURRENCY] [BASE_URL]
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    base_url = sys.argv[3] if len(sys.argv) > 3 else None
+
+    # Size the connection pool before the API models create their session,
+    # otherwise extra connections would be opened and thrown away
+    os.environ.setdefault("API_POOL_MAXSIZE", str(concurrency))
+
+    server = None
+    if base_url is None:
+        server = EchoServer().start()
+        base_url = server.url
+    print(
+        f"Load testing {base_url} with {count:,} GET requests, "
+        f"concurrency {concurrency}"
+    )
+
+    try:
+        clients = (("BaseAPI", _run_sync), ("AsyncBaseAPI", _run_async))
+        for name, run in clients:
+            results, seconds = run(base_url, count, concurrency)
+            # Connection errors and non-200 responses both count as errors
+            latencies = [
+                latency for latency, status in results if status == 200
+            ]
+            errors = len(results) - len(latencies)
+            _report(name, latencies, errors, seconds)
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    load_test_api()
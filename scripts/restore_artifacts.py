@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from utils.artifact_store import ArtifactStore
+
+
+def restore_artifacts():
+    """Restore a run's archived artifacts from the artifact store
+
+    Usage: poetry run restore_artifacts <RUN_TIMESTAMP> [DESTINATION]
+    """
+    store = ArtifactStore()
+    if len(sys.argv) < 2:
+        print("Usage: poetry run restore_artifacts <RUN_TIMESTAMP> [DEST]")
+        print("Stored runs:")
+        for run_id in store.runs():
+            print(f"  {run_id}")
+        sys.exit(1)
+
+    run_id = sys.argv[1]
+    destination = (
+        Path(sys.argv[2]) if len(sys.argv) > 2
+        else Path("reports") / "restored" / run_id
+    )
+    count = store.restore(run_id, destination)
+    print(f"Restored {count} artifacts to {destination}")
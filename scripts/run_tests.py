@@ -6,12 +6,22 @@ import pytest
 import sys
 import shutil
 import datetime
+import re
 from pathlib import Path
 
 from dotenv import load_dotenv
 import logging
 from utils.logging import pre_logger
 from utils.logging import main_logger
+from utils.logging import merge_event_streams, merge_worker_logs
+from utils.driver_cache import resolve_driver_paths
+from utils.artifact_store import ArtifactStore
+from utils.resources import recommended_workers
+from utils.incremental import (
+    affected_test_files,
+    changed_files,
+    incremental_mode,
+)
 logger = logging.getLogger()
 
 def set_runtime_env_vars():
@@ -44,6 +54,14 @@ def set_runtime_env_vars():
         if name not in os.environ:
             os.environ[name] = str(path)
 
+    # Keep webdriver_manager's downloads in the project so CI can cache them
+    for name, value in {
+        "WDM_LOCAL": "1",
+        "WDM_CACHE_DIR": os.path.abspath("drivers_cache")
+    }.items():
+        if name not in os.environ:
+            os.environ[name] = value
+
     # Create archive folders
     if os.getenv("SAVE_HISTORICAL_REPORTS", "false").lower() == "true":
         for name, path in {
@@ -212,13 +230,41 @@ class PytestCommandBuilder:
         # Handle parallel flag
         if os.getenv("PARALLEL", "false").lower() == "true":
             if not any(arg.startswith("-n") for arg in self._args):
-                self._args.insert(1, "auto")
+                self._args.insert(1, str(self._worker_count()))
                 self._args.insert(1, "-n")
+            # Keep each browser type on its own workers
+            if (
+                os.getenv("BROWSER_AFFINITY", "false").lower() == "true"
+                and not any(arg.startswith("--dist") for arg in self._args)
+            ):
+                self._args.insert(1, "--dist=loadgroup")
             print(
                 "[\033[93mWARNING\033[0m] "
-                "Parallelization may cause logs to be suppressed."
+                "Parallelization suppresses console logs from test workers. "
+                "Full logs are merged into logs.log after the run."
             )
 
+    def _worker_count(self) -> int:
+        """Pick a worker count that fits this machine's cores and memory.
+
+        Unlike `-n auto`, which only looks at CPU cores, this also checks
+        that every worker's browsers fit in the available memory.
+        """
+        browsers = [
+            name for name in ("chrome", "firefox", "edge")
+            if os.getenv(name.upper(), "true").lower() == "true"
+        ]
+        # Pooled workers keep an idle browser of every type they've used
+        per_worker = 1
+        if os.getenv("BROWSER_POOL", "true").lower() == "true":
+            per_worker = int(os.getenv("BROWSER_POOL_SIZE", 1))
+            if os.getenv("BROWSER_AFFINITY", "false").lower() != "true":
+                per_worker *= len(browsers)
+
+        workers = recommended_workers(browsers, per_worker)
+        logger.info(f"Running tests with {workers} parallel workers")
+        return workers
+
     def _html_reporting(self):
         """Add reporting-related flags to the pytest command arguments."""
         if not any(arg.startswith("--html") for arg in self._args):
@@ -243,6 +289,49 @@ class PytestCommandBuilder:
         """
         return self.command + self._args
 
+def resolve_drivers():
+    """Resolve browser driver binaries once, before any tests start.
+
+    Every pytest worker reuses the paths cached here instead of
+    asking webdriver_manager on each driver launch.
+    """
+    logger.info("Running resolve_drivers() in run_tests.py")
+    browsers = [
+        name for name in ("chrome", "firefox", "edge")
+        if os.getenv(name.upper(), "true").lower() == "true"
+    ]
+    resolve_driver_paths(browsers)
+
+def find_affected_tests():
+    """Find the test files affected by uncommitted or branch changes.
+
+    Only runs in INCREMENTAL mode. The result is handed to the pytest
+    processes in the INCREMENTAL_TESTS environment variable, where
+    conftest runs these tests and the last run's failures first or only.
+    """
+    mode = incremental_mode()
+    if mode is None:
+        return
+    logger.info("Running find_affected_tests() in run_tests.py")
+    test_files = sorted(Path("tests").rglob("test_*.py"))
+    changed = changed_files(os.getenv("INCREMENTAL_BASE") or None)
+    affected = affected_test_files(test_files, changed)
+    logger.info(
+        f"{len(affected)} of {len(test_files)} test files are affected "
+        f"by changes"
+    )
+    os.environ["INCREMENTAL_TESTS"] = os.pathsep.join(
+        str(path) for path in sorted(affected)
+    )
+
+def merge_logs():
+    """Merge parallel workers' log and event files into single files"""
+    logger.info("Running merge_logs() in run_tests.py")
+    for name in ("LATEST_REPORT_DIR", "TIMESTAMPED_REPORT_DIR"):
+        if name in os.environ:
+            merge_worker_logs(os.environ[name])
+    merge_event_streams(os.environ["LATEST_REPORT_DIR"])
+
 def create_historical_report(current_report_path: str | None = None):
     """Copy the current test report to a timestamped archive.
 
@@ -264,6 +353,37 @@ def create_historical_report(current_report_path: str | None = None):
         else:
             print("[WARNING] No test report found to archive.")
 
+def prune_historical_reports():
+    """Delete archived runs beyond the retention limit set in .env
+
+    Applies to both the timestamped report folders and the artifact store,
+    counted from the same list of runs. ARTIFACT_RETENTION_RUNS=0, the
+    default, keeps every run.
+    """
+    if os.getenv("SAVE_HISTORICAL_REPORTS", "false").lower() != "true":
+        return
+    keep_runs = int(os.getenv("ARTIFACT_RETENTION_RUNS", 0))
+    if keep_runs <= 0:
+        return
+
+    logger.info("Running prune_historical_reports() in run_tests.py")
+    store = ArtifactStore()
+
+    # Only touch folders named like a RUN_TIMESTAMP
+    timestamp_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
+    report_folders = {
+        path.name: path for path in Path("reports").iterdir()
+        if path.is_dir() and timestamp_pattern.match(path.name)
+    }
+    # A run may have a report folder, stored artifacts, or both
+    runs = sorted(set(report_folders) | set(store.runs()))
+
+    store.prune(keep_runs, runs)
+    for run_id in runs[:-keep_runs]:
+        if run_id in report_folders:
+            logger.info(f"Deleting historical report folder {run_id}")
+            shutil.rmtree(report_folders[run_id])
+
 def main():
     """Handle all customization for running tests with a single command"""
     # Create barebones logger for everything that runs before 
@@ -278,6 +398,12 @@ def main():
     # Create logger
     main_logger()
 
+    # Resolve browser drivers for all test workers
+    resolve_drivers()
+
+    # Narrow down or reorder the run based on changes and past failures
+    find_affected_tests()
+
     # Prepare pytest command for the console
     user_args = sys.argv[1:]
     pytest_command_builder = PytestCommandBuilder(user_args)
@@ -288,8 +414,12 @@ def main():
     logger.info(f"Test run started at {os.environ['RUN_TIMESTAMP']}")
     exit_code = pytest.main(cmd[1:])
 
+    # Combine the per-worker logs from parallel runs
+    merge_logs()
+
     # Copy the test report into an archive with a timestamp
     create_historical_report(pytest_command_builder.report_path)
+    prune_historical_reports()
     sys.exit(exit_code)
 
 if __name__ == "__main__":
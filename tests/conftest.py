@@ -3,17 +3,42 @@
 from __future__ import annotations
 
 import os
+import time
+from collections import defaultdict
+
 import pytest
-from shutil import copyfile
 
 # Conftest also runs all fixtures, so import any organized into other files
-from fixtures.fixtures_browser import driver  # noqa: F401
+from fixtures.fixtures_browser import browser_pool, driver  # noqa: F401
+from fixtures.fixtures_api import api_sessions, echo_server  # noqa: F401
+from models.pages.element_cache import ElementCache
+from utils.artifact_store import store_enabled
+from utils.artifacts import flush_artifacts, get_artifact_writer
+from utils.durations import (
+    GROUP_SUFFIX_PATTERN,
+    DurationHistory,
+    LongestFirstScheduling,
+    browser_affinity,
+    scheduling_enabled,
+)
+from utils.http_sessions import api_sessions as api_sessions_registry
+from utils.incremental import incremental_mode
+from utils.logging import events, main_logger
+from utils.resources import browser_memory
+from utils.result_cache import MARKER, ResultCache, result_cache_enabled
+from utils.timing import Timing
+from utils.webdriver_metrics import (
+    METRICS_ENABLED,
+    MetricsReport,
+    webdriver_metrics,
+)
 
 import logging
 logger = logging.getLogger()
 
-os.environ["WDM_LOCAL"] = "1"
-os.environ["WDM_CACHE_DIR"] = os.path.abspath("drivers_cache")
+# Normally set by the test launcher, which resolves drivers before pytest
+os.environ.setdefault("WDM_LOCAL", "1")
+os.environ.setdefault("WDM_CACHE_DIR", os.path.abspath("drivers_cache"))
 
 # Enforce script launcher:
 # This repo is not intended to be used with raw pytest commands.
@@ -23,20 +48,168 @@ if "RUN_TIMESTAMP" not in os.environ:
         "\n  `poetry run test`"
     )
 
+def _browser_param(item) -> str | None:
+    """Get the browser a test item is parametrized with, if any"""
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("driver") if callspec else None
+
+def _assign_browser_groups(items):
+    """Group tests by browser so each worker keeps one browser type warm.
+
+    Each browser's tests are split round-robin into enough groups to keep
+    every worker busy, and xdist's loadgroup mode runs each group on a
+    single worker.
+    """
+    browsers = sorted({_browser_param(item) for item in items} - {None})
+    if not browsers:
+        return
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
+    buckets = max(workers // len(browsers), 1)
+    assigned = defaultdict(int)
+    for item in items:
+        browser = _browser_param(item)
+        if browser is None:
+            continue
+        bucket = assigned[browser] % buckets
+        assigned[browser] += 1
+        item.add_marker(pytest.mark.xdist_group(f"{browser}-{bucket}"))
+
+def _select_incremental(config, items, mode: str):
+    """Move failed and changed tests to the front, or keep only those.
+
+    Failed tests come from pytest's own last-failed cache. Changed tests
+    are the files the run script found to import changed code.
+    """
+    affected = set(os.getenv("INCREMENTAL_TESTS", "").split(os.pathsep))
+    cache = getattr(config, "cache", None)
+    last_failed = {
+        GROUP_SUFFIX_PATTERN.sub("", nodeid)
+        for nodeid in (cache.get("cache/lastfailed", {}) if cache else {})
+    }
+
+    priority, rest = [], []
+    for item in items:
+        if item.nodeid in last_failed or str(item.path.resolve()) in affected:
+            priority.append(item)
+        else:
+            rest.append(item)
+    logger.info(
+        f"Incremental mode '{mode}': {len(priority)} failed or changed "
+        f"tests of {len(items)}"
+    )
+
+    if mode == "only":
+        if rest:
+            config.hook.pytest_deselected(items=rest)
+        items[:] = priority
+    else:
+        items[:] = priority + rest
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Xdist hook to spread longest-first ordered tests across workers"""
+    if config.getoption("dist") == "load" and scheduling_enabled():
+        return LongestFirstScheduling(config, log)
+    return None
+
+# Runs before xdist turns the xdist_group markers into node id suffixes
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
-    """Pytest hook to skip tests based on user configurations"""
+    """Pytest hook to skip and order tests based on user configurations"""
     skip = pytest.mark.skip(reason="Skipping tests that require secrets")
     for item in items:
         if "secrets" in item.keywords:
             if os.getenv("SKIP_SECRETS", "true").lower() == "true":
                 item.add_marker(skip)
 
+    # LongestFirstScheduling deals tests out in this order, so starting
+    # the slowest ones first keeps them from leaving other workers idle
+    # at the end of the run
+    if os.getenv("PYTEST_XDIST_WORKER") is not None and scheduling_enabled():
+        items[:] = DurationHistory().longest_first(items)
+
+    mode = incremental_mode()
+    if mode is not None:
+        _select_incremental(config, items, mode)
+
+    # xdist resets "dist" in workers but keeps the loadgroup flag
+    if config.getoption("loadgroup", False) and browser_affinity():
+        _assign_browser_groups(items)
+
+def _set_event_context(item, phase):
+    """Tag structured events with the test and phase that produced them"""
+    events.set_context(
+        nodeid=item.nodeid,
+        browser=_browser_param(item),
+        phase=phase
+    )
+
+# Passing results of tests marked with result_cache
+result_cache = ResultCache()
+_cache_passed = {}
+_cache_failed = set()
+# Tests whose body ran and passed, waiting on their teardown
+_cache_call_passed = set()
+
+def _check_result_cache(item):
+    """Skip a marked test whose inputs are unchanged since it last passed"""
+    marker = item.get_closest_marker(MARKER)
+    if marker is None:
+        return
+    key = result_cache.key(
+        item.nodeid,
+        item.path,
+        marker.kwargs.get("env", ())
+    )
+    passed_at = result_cache.lookup(item.nodeid, key)
+    if passed_at is None:
+        item.user_properties.append(("result_cache_key", key))
+        return
+    item.user_properties.append(("result_cache", "hit"))
+    pytest.skip(
+        "Result cache: passed at "
+        f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(passed_at))} "
+        "with identical inputs"
+    )
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Pytest hook that runs before each test's fixtures are set up"""
+    _set_event_context(item, "setup")
+    if METRICS_ENABLED:
+        webdriver_metrics.start_test(item.nodeid)
+    if result_cache_enabled():
+        _check_result_cache(item)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    """Pytest hook that runs before each test's body"""
+    _set_event_context(item, "call")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Pytest hook that runs before each test's fixtures are torn down"""
+    _set_event_context(item, "teardown")
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Capture screenshots on test failure and attach to HTML report."""
     outcome = yield
     rep = outcome.get_result()
 
+    events.emit(
+        "test_phase",
+        duration=rep.duration,
+        phase=rep.when,
+        outcome=rep.outcome
+    )
+
+    # Hand the test's WebDriver command metrics to the controller process
+    if METRICS_ENABLED and rep.when == "teardown":
+        rep.user_properties.append(
+            ("webdriver_metrics", webdriver_metrics.finish_test())
+        )
+
     if rep.when == "call" and rep.failed:
         driver = item.funcargs.get("driver")
         if driver is not None:
@@ -50,9 +223,19 @@ def pytest_runtest_makereport(item, call):
                 file_name
             )
 
-            driver.save_screenshot(latest_screenshot_path)
+            # Only grabbing the raw screenshot blocks the test process,
+            # the files are written in the background
+            with events.timed("artifact_capture", artifact="screenshot"):
+                screenshot = driver.get_screenshot_as_base64()
 
-            if os.getenv("SAVE_HISTORICAL_REPORTS", "false").lower() == "true":
+            archived_path = None
+            store_name = None
+            if store_enabled():
+                # Deduplicated and compressed instead of copied
+                store_name = f"screenshots/{file_name}"
+            elif os.getenv(
+                "SAVE_HISTORICAL_REPORTS", "false"
+            ).lower() == "true":
                 
                 TIMESTAMPED_SCREENSHOT_DIR = os.environ[
                     "TIMESTAMPED_SCREENSHOT_DIR"
@@ -61,17 +244,122 @@ def pytest_runtest_makereport(item, call):
                     TIMESTAMPED_SCREENSHOT_DIR,
                     file_name
                 )
-                copyfile(latest_screenshot_path, archived_path)
+
+            get_artifact_writer().write_screenshot(
+                screenshot,
+                latest_screenshot_path,
+                archived_path,
+                store_name
+            )
 
             if item.config.pluginmanager.hasplugin("html"):
                 from pytest_html import extras
-                extra = getattr(rep, "extra", [])
-                extra.append(extras.image(latest_screenshot_path))
-                rep.extra = extra
+                extra = getattr(rep, "extras", [])
+                extra.append(extras.image(screenshot))
+                rep.extras = extra
+
+# Session-wide WebDriver command metrics, aggregated from every worker
+metrics_report = MetricsReport()
+
+# Total setup, call and teardown time of every test that actually ran
+_test_durations = defaultdict(float)
+_tests_run = set()
+
+def pytest_runtest_logreport(report):
+    """Pytest hook that collects each test's duration and metrics"""
+    _test_durations[report.nodeid] += report.duration
+    if report.when == "call":
+        _tests_run.add(report.nodeid)
+    properties = dict(report.user_properties)
+    if "result_cache_key" in properties:
+        # Skipped and xfailed tests proved nothing, so only a real pass
+        # of the test body is cached
+        if report.failed:
+            _cache_failed.add(report.nodeid)
+        elif (
+            report.when == "call"
+            and report.passed
+            and not hasattr(report, "wasxfail")
+        ):
+            _cache_call_passed.add(report.nodeid)
+        elif (
+            report.when == "teardown"
+            and report.nodeid in _cache_call_passed
+        ):
+            _cache_passed[report.nodeid] = properties["result_cache_key"]
+    if METRICS_ENABLED and report.when == "teardown":
+        results = properties.get("webdriver_metrics")
+        metrics_report.add(
+            report.nodeid,
+            results or [],
+            _test_durations[report.nodeid]
+        )
+
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Pytest-html hook to add the WebDriver command tables to the report"""
+    prefix.extend(metrics_report.html_tables())
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_report_teststatus(report, config):
+    """Pytest hook to report result cache hits apart from real skips"""
+    if (
+        report.skipped
+        and dict(report.user_properties).get("result_cache") == "hit"
+    ):
+        return "cached", "c", "CACHED"
+
+def pytest_html_results_table_header(cells):
+    """Pytest-html hook to add a result cache column to the report"""
+    if result_cache_enabled():
+        cells.insert(2, "<th>Result cache</th>")
+
+def pytest_html_results_table_row(report, cells):
+    """Pytest-html hook to show whether a result came from the cache"""
+    if result_cache_enabled():
+        properties = dict(report.user_properties)
+        if properties.get("result_cache") == "hit":
+            status = "Cached pass (not run)"
+        elif "result_cache_key" in properties:
+            status = "Ran"
+        else:
+            status = ""
+        cells.insert(2, f"<td>{status}</td>")
 
 def pytest_configure(config):
     """Pytest hook to configure pytest settings"""
-    pass
+    # Parallel workers are separate processes that need their own logger,
+    # writing to a per-worker log file merged by the run script
+    if os.getenv("PYTEST_XDIST_WORKER") is not None:
+        main_logger()
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    """Pytest hook to finish artifacts and report run-wide statistics"""
+    flush_artifacts()
+    events.flush()
+    browser_memory.save()
+    logger.info(f"Wait polling: {Timing.metrics.summary()}")
+    logger.info(f"Element cache: {ElementCache.totals.summary()}")
+    if api_sessions_registry.stats():
+        logger.info(f"API connections: {api_sessions_registry.summary()}")
+    if metrics_report.by_test:
+        logger.info(f"WebDriver commands: {metrics_report.summary()}")
+
+    # Only the main process sees every worker's results
+    if os.getenv("PYTEST_XDIST_WORKER") is None:
+        DurationHistory().record({
+            nodeid: duration
+            for nodeid, duration in _test_durations.items()
+            if nodeid in _tests_run
+        })
+        result_cache.save(
+            {
+                nodeid: key
+                for nodeid, key in _cache_passed.items()
+                if nodeid not in _cache_failed
+            },
+            _cache_failed
+        )
 
 def pytest_addoption(parser):
     """Space for adding custom command line options for pytest"""
@@ -1,10 +1,17 @@
 # tests/test_postman_echo.py
 from __future__ import annotations
+import asyncio
 import os
 import pytest
-from models.apis.examples.postman_api import PostmanEchoAPI
+from models.apis.examples.postman_api import (
+    AsyncPostmanEchoAPI,
+    PostmanEchoAPI,
+)
+from utils.cassette import CassetteMissError, cassette_mode
+from utils.http_sessions import SESSION_REUSE
 
 @pytest.mark.example
+@pytest.mark.result_cache
 def test_example_postman_echo_get():
     """Example API request: GET with query parameters"""
     api = PostmanEchoAPI()
@@ -15,6 +22,7 @@ def test_example_postman_echo_get():
     assert response.json()["args"] == params
 
 @pytest.mark.example
+@pytest.mark.result_cache
 def test_example_postman_echo_post():
     """Example API request: POST with JSON"""
     api = PostmanEchoAPI()
@@ -24,6 +32,34 @@ def test_example_postman_echo_post():
     assert response.status_code == 200
     assert response.json()["json"] == payload
 
+@pytest.mark.example
+def test_example_postman_connection_reuse(api_sessions):
+    """Example API requests sharing one kept-alive connection"""
+    if not SESSION_REUSE:
+        pytest.skip("API_SESSION_REUSE is turned off")
+    if cassette_mode() in ("replay", "auto"):
+        pytest.skip("Cassettes may answer without opening connections")
+
+    for value in ("first", "second"):
+        response = PostmanEchoAPI().echo_get({"value": value})
+        assert response.status_code == 200
+
+    counts = api_sessions.stats().get("postman-echo.com")
+    assert counts, "No connections to postman-echo.com were recorded"
+    assert counts["reused_connections"] >= 1
+
+@pytest.mark.example
+def test_example_postman_echo_concurrent():
+    """Example async API requests: many GETs with a concurrency limit"""
+    params = [{"item": str(i)} for i in range(20)]
+
+    async def send_all():
+        async with AsyncPostmanEchoAPI(max_concurrency=5) as api:
+            return await api.map(api.echo_get, params)
+
+    responses = asyncio.run(send_all())
+    assert [response.json()["args"] for response in responses] == params
+
 @pytest.mark.example
 @pytest.mark.secrets
 def test_example_postman_basic_auth():
@@ -40,3 +76,46 @@ def test_example_postman_basic_auth():
 
     assert response.status_code == 200
     assert response.json() == {"authenticated": True}
+
+@pytest.mark.example
+def test_example_local_echo_server(echo_server):
+    """Example API requests against the local stand-in server"""
+    api = PostmanEchoAPI(base_url=echo_server.url)
+
+    assert api.echo_get({"foo": "bar"}).json()["args"] == {"foo": "bar"}
+    assert api.echo_post({"key": "value"}).json()["json"] == {"key": "value"}
+
+    response = api.with_auth("postman", "password").basic_auth()
+    assert response.json() == {"authenticated": True}
+
+@pytest.mark.example
+def test_example_streamed_response(echo_server):
+    """Example API request: checking records as they are streamed in"""
+    api = PostmanEchoAPI(base_url=echo_server.url)
+
+    with api.echo_stream(100, {"foo": "bar"}) as stream:
+        assert stream.status_code == 200
+        for expected_id, record in enumerate(stream.iter_ndjson()):
+            assert record["id"] == expected_id
+            assert record["args"] == {"foo": "bar"}
+
+@pytest.mark.example
+def test_example_cassette_round_trip(echo_server, tmp_path, monkeypatch):
+    """Example API requests recorded once, then replayed offline"""
+    monkeypatch.setenv("API_CASSETTE_DIR", str(tmp_path))
+    params = {"foo": "bar"}
+
+    monkeypatch.setenv("API_CASSETTE_MODE", "record")
+    recorded = PostmanEchoAPI(base_url=echo_server.url).echo_get(params)
+    assert recorded.json()["args"] == params
+    assert [path.name for path in tmp_path.iterdir()] == ["localhost.jsonl"]
+
+    # Nothing listens on this port, so the response must come from disk
+    monkeypatch.setenv("API_CASSETTE_MODE", "replay")
+    offline_api = PostmanEchoAPI(base_url="http://127.0.0.1:9")
+    replayed = offline_api.echo_get(params)
+    assert replayed.status_code == recorded.status_code
+    assert replayed.json() == recorded.json()
+
+    with pytest.raises(CassetteMissError):
+        offline_api.echo_get({"never": "recorded"})
@@ -0,0 +1,70 @@
+# tests/examples/test_example_element_cache.py
+from __future__ import annotations
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from models.pages.element_cache import ElementCache
+
+class CountingDriver:
+    """Stand-in driver that counts its browser calls"""
+
+    def __init__(self):
+        self.script_calls = 0
+        self.document_id = "first-page"
+        self.element_ids = iter(["element-1", "element-2", "element-3"])
+        self.stale_ids = set()
+        self.commands = []
+
+    def execute_script(self, script, *args):
+        self.script_calls += 1
+        return [self.document_id, WebElement(self, next(self.element_ids))]
+
+    def execute(self, command, params):
+        if params["id"] in self.stale_ids:
+            raise StaleElementReferenceException("stale element")
+        self.commands.append((command, params["id"]))
+        return {"value": None}
+
+LOCATOR = (By.ID, "search")
+
+@pytest.mark.example
+def test_example_element_cache_hits_skip_the_browser():
+    """Example element cache: repeat lookups make no browser calls"""
+    driver = CountingDriver()
+    cache = ElementCache()
+
+    first = cache.get(driver, "search", LOCATOR)
+    for _ in range(5):
+        assert cache.get(driver, "search", LOCATOR) is first
+
+    assert driver.script_calls == 1
+    assert (cache.stats.hits, cache.stats.misses) == (5, 1)
+
+@pytest.mark.example
+def test_example_element_cache_refinds_stale_elements():
+    """Example element cache: a stale element is found again on use"""
+    driver = CountingDriver()
+    cache = ElementCache()
+    element = cache.get(driver, "search", LOCATOR)
+
+    driver.stale_ids.add("element-1")
+    element.click()
+
+    assert driver.script_calls == 2
+    assert driver.commands == [("clickElement", "element-2")]
+    assert cache.stats.stale == 1
+
+@pytest.mark.example
+def test_example_element_cache_drops_entries_after_navigation():
+    """Example element cache: a new document id drops older elements"""
+    driver = CountingDriver()
+    cache = ElementCache()
+    cache.get(driver, "search", LOCATOR)
+
+    driver.document_id = "second-page"
+    cache.get(driver, "other", (By.ID, "other"))
+    cache.get(driver, "search", LOCATOR)
+
+    assert driver.script_calls == 3
+    assert cache.stats.misses == 3
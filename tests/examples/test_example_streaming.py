@@ -0,0 +1,55 @@
+# tests/examples/test_example_streaming.py
+from __future__ import annotations
+import json
+import pytest
+from utils.streaming import StreamedResponse
+
+class ChunkedResponse:
+    """Stand-in for a streamed requests.Response, sent a few bytes at a time"""
+
+    def __init__(self, body: str, chunk_size: int):
+        self.body = body.encode("utf-8")
+        self.chunk_size = chunk_size
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+    def close(self):
+        pass
+
+VALID_ARRAYS = [
+    "[]",
+    " [ 1 , 2 ,3 ] ",
+    '[1, "a,]b", {"x": [1, 2]}, true, null, -1.5e3]',
+    '[123456789, "caf\\u00e9", "é"]',
+]
+
+MALFORMED_ARRAYS = [
+    "[1 2]",
+    "[1,,2]",
+    "[1,]",
+    "[,1]",
+    "[1",
+    '{"a": 1}',
+    "[1] 2",
+    "[tru]",
+    '[{"a" 1}]',
+]
+
+@pytest.mark.example
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize("body", VALID_ARRAYS)
+def test_example_json_array_stream(body, chunk_size):
+    """Example streamed JSON array: same items as json.loads"""
+    stream = StreamedResponse(ChunkedResponse(body, chunk_size))
+    assert list(stream.iter_json_array()) == json.loads(body)
+
+@pytest.mark.example
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize("body", MALFORMED_ARRAYS)
+def test_example_malformed_json_array_stream(body, chunk_size):
+    """Example streamed JSON array: malformed bodies fail like json.loads"""
+    stream = StreamedResponse(ChunkedResponse(body, chunk_size))
+    with pytest.raises(json.JSONDecodeError):
+        list(stream.iter_json_array())
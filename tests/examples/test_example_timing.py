@@ -9,9 +9,10 @@ to illustrate what exceptions will look like
 """
 # Standard library imports
 from __future__ import annotations
+import time
 import pytest
 from selenium.webdriver.common.by import By
-from utils.timing import Timing
+from utils.timing import AdaptivePolling, Timing
 from models.pages.examples.wikipedia.home_page import WikipediaHomePage
 
 OVERRIDE_DEFAULT_TIMEOUT_FOR_DEMO = 2
@@ -167,3 +168,20 @@ def test_wait_until_true_on_timeout_hook(driver):
     assert timeout_action["called"], (
         "on_timeout action was not called after timeout error"
     )
+
+@pytest.mark.wait_true
+@pytest.mark.example
+def test_wait_until_true_adaptive_polling():
+    # A condition that becomes true shortly after the wait starts
+    ready_at = time.time() + 0.05
+
+    Timing.wait_until_true(
+        lambda: time.time() >= ready_at,
+        timeout=OVERRIDE_DEFAULT_TIMEOUT_FOR_DEMO,
+        strategy=AdaptivePolling(initial=0.01, max_interval=0.5, jitter=0.1)
+    )
+
+    # Fast initial polls notice the change well before a fixed 0.5s interval
+    assert Timing.metrics.last["met"]
+    assert Timing.metrics.last["seconds"] < 0.5
+    assert Timing.metrics.last["polls"] > 1
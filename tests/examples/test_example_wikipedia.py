@@ -46,5 +46,21 @@ def test_example_wikipedia(driver):
         f"but actual: '{driver.title}'"
     )
 
+@pytest.mark.example
+@pytest.mark.wikipedia
+def test_example_wikipedia_snapshot(driver):
+    """Example of checking several elements with a single WebDriver call"""
+
+    home_page = WikipediaHomePage(driver)
+    home_page.load()
+
+    # Resolve every locator on the page, with its state, in one round-trip
+    snapshot = home_page.snapshot()
+    assert not snapshot.missing(), (
+        f"Expected all locators to be found, missing: {snapshot.missing()}"
+    )
+    assert snapshot.is_displayed("search_box")
+    assert snapshot["search_box"].get_attribute("name") == "search"
+
 if __name__ == "__main__":
     test_example_wikipedia()
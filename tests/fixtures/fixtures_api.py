@@ -0,0 +1,27 @@
+"""Fixtures for handling API clients"""
+
+# Standard imports
+from __future__ import annotations
+
+__all__ = ['api_sessions', 'echo_server']  # Public fixtures
+
+# Local imports
+import pytest
+
+from utils.echo_server import EchoServer
+from utils.http_sessions import api_sessions as session_registry
+
+# Launch the logger
+import logging
+logger = logging.getLogger()
+
+@pytest.fixture(scope="session")
+def api_sessions():
+    """Process-wide registry of pooled API sessions and their counters"""
+    return session_registry
+
+@pytest.fixture(scope="session")
+def echo_server():
+    """Local stand-in for postman-echo.com, one per xdist worker"""
+    with EchoServer() as server:
+        yield server
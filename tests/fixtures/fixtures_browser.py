@@ -3,8 +3,9 @@
 # Standard imports
 from __future__ import annotations
 import os
+import time
 
-__all__ = ['driver']  # Public fixture
+__all__ = ['browser_pool', 'driver']  # Public fixtures
 
 # Local imports
 import pytest
@@ -15,9 +16,17 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from utils.browser_pool import POOL_ENABLED, BrowserPool
+from utils.driver_cache import get_driver_path
+from utils.logging import events
+from utils.resources import browser_memory, memory_sampling
+from utils.resource_blocking import (
+    apply_blocklist,
+    firefox_preferences,
+    global_blocklist,
+)
+from utils.webdriver_metrics import METRICS_ENABLED, webdriver_metrics
 
 # Launch the logger
 import logging
@@ -41,15 +50,14 @@ def apply_window_size(
     """Resize the window"""
     driver.set_window_size(int(width), int(height))
 
-browserCoverage = [name for name, enabled in browserConfigs.items() if enabled]
-@pytest.fixture(params=browserCoverage)
-def driver(request):
-    """Cross browser handling for webdriver calls"""
-    logger.info("Running driver() in fixtures_browser.py")
-    browser = request.param
+def is_headless() -> bool:
+    """Determine if the .env file has been configured for headless mode"""
+    return os.environ.get("HEADLESS", "false").lower() == "true"
 
-    # Determine if the .env file has been configured for headless mode
-    headless = os.environ.get("HEADLESS", "false").lower() == "true"
+def create_driver(browser: str):
+    """Launch a new webdriver instance for the given browser name"""
+    started = time.perf_counter()
+    headless = is_headless()
 
     # Chrome
     if browser == "chrome":
@@ -69,7 +77,7 @@ def driver(request):
 
 
         # Create the Chrome driver instance
-        chrome_path = ChromeDriverManager().install()
+        chrome_path = get_driver_path("chrome")
         driver = webdriver.Chrome(
             service=ChromeService(chrome_path),
             options=options
@@ -93,8 +101,12 @@ def driver(request):
             options.add_argument(f"--width={DEFAULT_BROWSER_WIDTH}")
             options.add_argument(f"--height={DEFAULT_BROWSER_HEIGHT}")
 
+        # Firefox blocks resources through preferences set at launch
+        for name, value in firefox_preferences().items():
+            options.set_preference(name, value)
+
         # Create the Firefox driver instance
-        gecko = GeckoDriverManager().install()
+        gecko = get_driver_path("firefox")
         driver = webdriver.Firefox(
             service=FirefoxService(gecko),
             options=options
@@ -117,7 +129,7 @@ def driver(request):
             options.add_argument("--disable-dev-shm-usage")
         
         # Create the Edge driver instance
-        edge_path = EdgeChromiumDriverManager().install()
+        edge_path = get_driver_path("edge")
         driver = webdriver.Edge(
             service=EdgeService(edge_path),
             options=options
@@ -128,5 +140,49 @@ def driver(request):
         raise ValueError(f"Unsupported browser: {browser}")
 
     apply_window_size(driver, headless)
+    apply_blocklist(driver, global_blocklist())
+    if METRICS_ENABLED:
+        webdriver_metrics.instrument(driver)
+    events.emit(
+        "driver_startup",
+        duration=time.perf_counter() - started,
+        browser=browser
+    )
+    return driver
+
+def reset_driver(driver):
+    """Restore a pooled driver's window size and global URL blocklist"""
+    apply_window_size(driver, is_headless())
+    # Drops any extra patterns a page model added
+    apply_blocklist(driver, global_blocklist())
+
+browserCoverage = [name for name, enabled in browserConfigs.items() if enabled]
+@pytest.fixture(scope="session")
+def browser_pool():
+    """Session-wide pool of warm drivers, one pool per xdist worker"""
+    pool = BrowserPool(factory=create_driver, on_reset=reset_driver)
+    yield pool
+    pool.close()
+
+@pytest.fixture(params=browserCoverage)
+def driver(request):
+    """Cross browser handling for webdriver calls"""
+    logger.info("Running driver() in fixtures_browser.py")
+    browser = request.param
+
+    # Pooling can be turned off in the .env to launch a browser per test
+    if not POOL_ENABLED:
+        driver = create_driver(browser)
+        yield driver
+        if memory_sampling():
+            browser_memory.sample(browser, driver)
+        driver.quit()
+        return
+
+    pool = request.getfixturevalue("browser_pool")
+    driver = pool.acquire(browser)
     yield driver
-    driver.quit()
+    # Measured after the test, once the page has done its work
+    if memory_sampling():
+        browser_memory.sample(browser, driver)
+    pool.release(driver)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from utils.cache_file import JsonCacheFile
+
+try:
+    import zstandard
+except ImportError:  # Optional: gzip is used when zstandard isn't installed
+    zstandard = None
+
+import logging
+logger = logging.getLogger()
+
+STORE_FOLDER = Path("reports") / "store"
+
+CODECS = {
+    "zst": (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    ),
+    "gz": (
+        lambda data: gzip.compress(data, compresslevel=6),
+        gzip.decompress,
+    ),
+}
+
+
+def store_enabled() -> bool:
+    """Check whether archived artifacts should go to the ArtifactStore"""
+    return (
+        os.getenv("SAVE_HISTORICAL_REPORTS", "false").lower() == "true"
+        and os.getenv("ARTIFACT_STORE", "true").lower() == "true"
+    )
+
+
+class ArtifactStore:
+    """Content-addressed, compressed storage for archived test artifacts.
+
+    Each unique screenshot or DOM dump is stored once as a compressed blob
+    named after its SHA-256 hash. Every run keeps a small manifest mapping
+    artifact names to blobs, so identical artifacts across runs cost no
+    extra disk space.
+
+    Layout:
+        reports/store/objects/<2 chars>/<sha256>.<zst|gz>
+        reports/store/manifests/<RUN_TIMESTAMP>.json
+
+    Usage example:
+        store = ArtifactStore()
+        store.put("screenshots/test_login.png", png_bytes)
+        store.restore("2025-01-01_10-00-00", "reports/restored")
+
+    """
+
+    def __init__(self, root=STORE_FOLDER, run_id: str | None = None):
+        self.root = Path(root)
+        self.run_id = run_id or os.getenv("RUN_TIMESTAMP", "unknown_run")
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.codec = "zst" if zstandard is not None else "gz"
+
+    def put(self, name: str, data: bytes) -> str:
+        """Store an artifact for the current run.
+
+        Args:
+            name (str): Path of the artifact within the run, e.g.
+                "screenshots/test_login.png".
+            data (bytes): Raw artifact contents.
+
+        Returns:
+            str: The SHA-256 digest the artifact is stored under.
+
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self._find_blob(digest) is None:
+            blob_path = self._blob_path(digest, self.codec)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            compress, _ = CODECS[self.codec]
+            tmp_path = blob_path.with_name(
+                f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}"
+            )
+            with open(tmp_path, "wb") as f:
+                f.write(compress(data))
+            os.replace(tmp_path, blob_path)
+        else:
+            logger.debug(f"Artifact {name} already stored as {digest}")
+
+        with self._manifest(self.run_id).update() as manifest:
+            manifest[name] = {"sha256": digest, "size": len(data)}
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Read and decompress a stored blob by its digest"""
+        blob_path = self._find_blob(digest)
+        if blob_path is None:
+            raise FileNotFoundError(f"No stored artifact with hash {digest}")
+        _, decompress = CODECS[blob_path.suffix[1:]]
+        with open(blob_path, "rb") as f:
+            return decompress(f.read())
+
+    def runs(self) -> list[str]:
+        """Get the ids of all runs with a manifest, oldest first"""
+        if not self.manifests_dir.exists():
+            return []
+        return sorted(path.stem for path in self.manifests_dir.glob("*.json"))
+
+    def restore(self, run_id: str, destination) -> int:
+        """Write every artifact from a run back out as regular files.
+
+        Returns:
+            int: The number of artifacts restored.
+
+        """
+        manifest = self._manifest(run_id).read()
+        for name, entry in manifest.items():
+            path = Path(destination) / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(self.get(entry["sha256"]))
+        return len(manifest)
+
+    def prune(self, keep_runs: int, runs: list[str] | None = None) -> int:
+        """Delete all but the newest runs, then any blobs they orphaned.
+
+        Args:
+            keep_runs (int): How many of the most recent runs to keep.
+                Zero or less keeps everything.
+            runs (list[str]): Every run id, oldest first, so runs that
+                archived no artifacts still count towards `keep_runs`.
+                Defaults to the runs with a manifest.
+
+        Returns:
+            int: The number of blobs deleted.
+
+        """
+        runs = sorted(runs) if runs is not None else self.runs()
+        if keep_runs <= 0 or len(runs) <= keep_runs:
+            return 0
+
+        for run_id in runs[:-keep_runs]:
+            manifest_path = self.manifests_dir / f"{run_id}.json"
+            if manifest_path.exists():
+                logger.info(f"Pruning stored artifacts for run {run_id}")
+                manifest_path.unlink()
+
+        referenced = {
+            entry["sha256"]
+            for run_id in runs[-keep_runs:]
+            for entry in self._manifest(run_id).read().values()
+        }
+        deleted = 0
+        for blob_path in self.objects_dir.glob("*/*"):
+            if blob_path.name.split(".")[0] not in referenced:
+                blob_path.unlink()
+                deleted += 1
+        logger.info(f"Pruned {deleted} unreferenced artifact blobs")
+        return deleted
+
+    def _manifest(self, run_id: str) -> JsonCacheFile:
+        return JsonCacheFile(self.manifests_dir / f"{run_id}.json")
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.{codec}"
+
+    def _find_blob(self, digest: str) -> Path | None:
+        for codec in CODECS:
+            path = self._blob_path(digest, codec)
+            if path.exists():
+                return path
+        return None
+
+
+_artifact_store = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the process-wide ArtifactStore for the current run"""
+    global _artifact_store
+    if _artifact_store is None:
+        _artifact_store = ArtifactStore()
+    return _artifact_store
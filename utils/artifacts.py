@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import atexit
+import base64
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from utils.artifact_store import get_artifact_store
+
+import logging
+logger = logging.getLogger()
+
+# Background writer configuration from the .env file
+ARTIFACT_WORKERS = int(os.getenv("ARTIFACT_WORKERS", 2))
+ARTIFACT_QUEUE_SIZE = int(os.getenv("ARTIFACT_QUEUE_SIZE", 32))
+
+# Linux ioctl for copy-on-write clones (btrfs, xfs, ...)
+FICLONE = 0x40049409
+
+
+def link_or_copy(source, destination):
+    """Place a copy of a file without duplicating its data when possible.
+
+    Tries a hardlink first, then a copy-on-write reflink, and only falls
+    back to a full copy when the filesystem supports neither.
+    """
+    source, destination = Path(source), Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if destination.exists():
+        destination.unlink()
+
+    try:
+        os.link(source, destination)
+        return
+    except OSError:
+        pass
+
+    try:
+        import fcntl
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+
+    shutil.copyfile(source, destination)
+
+
+class ArtifactWriter:
+    """Write failure artifacts to disk on background threads.
+
+    Tests hand over the raw data they grabbed from the driver and move on.
+    Decoding, disk writes and archive copies happen in a thread pool.
+
+    Important:
+      - The queue is bounded. When it is full, `submit()` blocks until a
+        slot frees up, so a burst of failures can't exhaust memory.
+      - Call `flush()` before anything reads the files (e.g. at the end of
+        the session). It is also registered to run at interpreter exit.
+
+    """
+
+    def __init__(
+        self,
+        workers: int = ARTIFACT_WORKERS,
+        queue_size: int = ARTIFACT_QUEUE_SIZE
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1),
+            thread_name_prefix="artifact-writer"
+        )
+        self._slots = threading.BoundedSemaphore(max(queue_size, 1))
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args):
+        """Queue a write job, blocking while the queue is full"""
+        self._slots.acquire()
+        future = self._executor.submit(func, *args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def write_screenshot(
+        self,
+        png_base64: str,
+        path,
+        archive_path=None,
+        store_name: str | None = None
+    ):
+        """Decode and save a screenshot, optionally archiving it too.
+
+        Args:
+            png_base64 (str): Screenshot as returned by the driver.
+            path: Where to save the PNG.
+            archive_path: Optional second location, linked where possible.
+            store_name (str): Optional name to archive the screenshot
+                under in the ArtifactStore.
+
+        """
+        return self.submit(
+            self._write_bytes,
+            lambda: base64.b64decode(png_base64),
+            path,
+            archive_path,
+            store_name
+        )
+
+    def write_text(
+        self,
+        text: str,
+        path,
+        archive_path=None,
+        store_name: str | None = None
+    ):
+        """Save text such as a DOM dump, optionally archiving it too"""
+        return self.submit(
+            self._write_bytes,
+            lambda: text.encode("utf-8"),
+            path,
+            archive_path,
+            store_name
+        )
+
+    def flush(self, timeout: float | None = None):
+        """Wait for all queued artifacts to be written"""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            logger.debug(f"Flushing {len(pending)} queued artifacts")
+            wait(pending, timeout=timeout)
+
+    def _write_bytes(self, get_data, path, archive_path, store_name):
+        data = get_data()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        if archive_path is not None:
+            link_or_copy(path, archive_path)
+        if store_name is not None:
+            get_artifact_store().put(store_name, data)
+        logger.debug(f"Artifact saved to {path}")
+
+    def _on_done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Failed to write artifact: {error}")
+
+
+_artifact_writer = None
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Get the process-wide ArtifactWriter, creating it on first use"""
+    global _artifact_writer
+    if _artifact_writer is None:
+        _artifact_writer = ArtifactWriter()
+        atexit.register(_artifact_writer.flush)
+    return _artifact_writer
+
+
+def flush_artifacts():
+    """Wait for queued artifacts, if any were ever written"""
+    if _artifact_writer is not None:
+        _artifact_writer.flush()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+import logging
+logger = logging.getLogger()
+
+# Pool configuration from the .env file
+POOL_ENABLED = os.getenv("BROWSER_POOL", "true").lower() == "true"
+POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", 1))
+MAX_REUSE = int(os.getenv("BROWSER_MAX_REUSE", 50))
+
+# Clears web storage for whatever origin the browser is currently on.
+# about:blank and data: pages do not allow storage access, so guard it.
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Browser names Chrome and Edge report in their capabilities
+CHROMIUM_BROWSER_NAMES = {"chrome", "chromium", "msedge", "microsoftedge"}
+
+
+def is_chromium(driver) -> bool:
+    """Check whether a driver supports Chrome DevTools Protocol commands.
+
+    Every Selenium driver has `execute_cdp_cmd()`, but only Chromium based
+    browsers implement it, so this checks the reported browser name.
+    """
+    capabilities = getattr(driver, "caps", None) or {}
+    name = str(capabilities.get("browserName", "")).lower()
+    return name in CHROMIUM_BROWSER_NAMES
+
+
+class PooledDriver:
+    """Bookkeeping for a single driver owned by the pool."""
+
+    def __init__(self, browser: str, driver):
+        self.browser = browser
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """Keep warm WebDriver instances per browser type for reuse across tests.
+
+    Launching a browser is by far the slowest part of a UI test, so rather
+    than quitting the driver after every test the pool resets it to a clean
+    state and hands it to the next test that asks for the same browser.
+
+    Responsibilities:
+      - Lazily creates drivers through the provided factory.
+      - Resets drivers between tests (cookies, storage, windows, size).
+      - Recycles drivers that fail a health check or exceed `max_reuse`.
+      - Keeps at most `size` idle drivers per browser type.
+
+    Important:
+      - Pytest session scope is per xdist worker, so each worker
+        owns its own pool and no driver is ever shared across processes.
+
+    Usage example:
+        pool = BrowserPool(factory=create_driver, on_reset=apply_size)
+        driver = pool.acquire("chrome")
+        ...
+        pool.release(driver)
+        pool.close()
+
+    """
+
+    def __init__(
+        self,
+        factory,
+        size: int = POOL_SIZE,
+        max_reuse: int = MAX_REUSE,
+        on_reset=None,
+    ):
+        """Create an empty pool.
+
+        Args:
+            factory (callable): Takes a browser name and returns a new driver.
+            size (int): Max idle drivers kept warm per browser type.
+            max_reuse (int): Tests a driver may serve before it is replaced.
+            on_reset (callable): Optional hook run on a driver during reset.
+
+        """
+        self.factory = factory
+        self.size = max(size, 1)
+        self.max_reuse = max(max_reuse, 1)
+        self.on_reset = on_reset
+        self._idle = defaultdict(deque)
+        self._in_use = {}
+
+    def acquire(self, browser: str):
+        """Get a healthy driver for the browser, launching one if needed."""
+        idle = self._idle[browser]
+        while idle:
+            pooled = idle.popleft()
+            if self._is_healthy(pooled):
+                logger.info(
+                    f"Reusing pooled {browser} driver "
+                    f"(use {pooled.uses + 1} of {self.max_reuse})"
+                )
+                break
+            self._discard(pooled, reason="failed health check")
+        else:
+            logger.info(f"Launching new pooled {browser} driver")
+            pooled = PooledDriver(browser, self.factory(browser))
+
+        pooled.uses += 1
+        self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver, recycle: bool = False):
+        """Return a driver to the pool once a test is done with it.
+
+        Args:
+            driver: A driver previously handed out by `acquire()`.
+            recycle (bool): Quit the driver instead of keeping it warm.
+
+        """
+        pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            logger.warning("Released a driver that the pool does not own")
+            return
+
+        if recycle:
+            self._discard(pooled, reason="recycle requested")
+        elif pooled.uses >= self.max_reuse:
+            self._discard(pooled, reason="reached BROWSER_MAX_REUSE")
+        elif len(self._idle[pooled.browser]) >= self.size:
+            self._discard(pooled, reason="pool is full")
+        elif self._reset_or_fail(pooled):
+            self._idle[pooled.browser].append(pooled)
+        else:
+            self._discard(pooled, reason="reset failed")
+
+    def close(self):
+        """Quit every driver the pool still holds."""
+        for pooled in list(self._in_use.values()):
+            self._discard(pooled, reason="pool closing")
+        self._in_use.clear()
+        for idle in self._idle.values():
+            while idle:
+                self._discard(idle.popleft(), reason="pool closing")
+
+    def _reset_or_fail(self, pooled: PooledDriver) -> bool:
+        """Reset a driver, treating any error as a failed reset.
+
+        The driver has already left `_in_use`, so an exception escaping
+        here would leave a browser that is never quit.
+        """
+        try:
+            return self._reset(pooled)
+        except Exception as e:
+            logger.warning(
+                f"Unexpected error resetting pooled {pooled.browser}: {e!r}"
+            )
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """Return the driver to a blank state for the next test."""
+        driver = pooled.driver
+        try:
+            # Close any extra windows or tabs the test opened
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin, so clear it before leaving the page
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            # The commands above only reach the current origin
+            chromium = is_chromium(driver)
+            if chromium:
+                self._clear_visited_origins(driver)
+            driver.get("about:blank")
+            if chromium:
+                driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+
+            if self.on_reset is not None:
+                self.on_reset(driver)
+        except WebDriverException as e:
+            logger.warning(f"Could not reset pooled {pooled.browser}: {e}")
+            return False
+        return True
+
+    def _clear_visited_origins(self, driver):
+        """Clear every cookie and the storage of every visited origin.
+
+        Chromium only, through the DevTools Protocol. Origins are taken
+        from the tab's navigation history, which is reset after each test,
+        so storage written by iframes or by windows the test closed is
+        not covered.
+        """
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for entry in history.get("entries", []):
+            scheme, netloc = urlsplit(entry.get("url", ""))[:2]
+            if scheme in ("http", "https"):
+                origins.add(f"{scheme}://{netloc}")
+        for origin in origins:
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"}
+            )
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """Check the browser session still responds to commands."""
+        try:
+            pooled.driver.current_url
+        except WebDriverException as e:
+            logger.debug(f"Pooled {pooled.browser} health check failed: {e}")
+            return False
+        return True
+
+    def _discard(self, pooled: PooledDriver, reason: str):
+        """Quit a driver that is leaving the pool."""
+        logger.info(f"Quitting pooled {pooled.browser} driver ({reason})")
+        try:
+            pooled.driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"Ignoring error while quitting driver: {e}")
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import logging
+logger = logging.getLogger()
+
+
+# Windows process access right and exit code for a running process
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_STILL_ACTIVE = 259
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process with the given id is still running"""
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(
+            _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        try:
+            if not kernel32.GetExitCodeProcess(
+                handle, ctypes.byref(exit_code)
+            ):
+                return True
+        finally:
+            kernel32.CloseHandle(handle)
+        return exit_code.value == _STILL_ACTIVE
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, but belongs to another user
+    return True
+
+
+class FileLock:
+    """Cross-process lock backed by an exclusively created lock file.
+
+    Works the same on Windows, macOS and Linux, which lets the test runner
+    and every xdist worker safely share small cache files on disk.
+
+    Usage example:
+        with FileLock("drivers_cache/driver_paths.json.lock"):
+            ...
+
+    """
+
+    def __init__(
+        self,
+        path,
+        timeout: float = 30.0,
+        stale_after: float = 120.0
+    ):
+        """Create a lock for the given lock file path.
+
+        Args:
+            path: Location of the lock file.
+            timeout (float): Max seconds to wait for the lock.
+            stale_after (float): Age in seconds after which a leftover
+                lock file from a crashed process is removed. A lock whose
+                owner is still running is never stale, however long it is
+                held, e.g. during a slow driver download.
+
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd = None
+
+    def acquire(self):
+        """Block until the lock is held or raise TimeoutError."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        end_time = time.time() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(
+                    self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+                os.write(self._fd, str(os.getpid()).encode())
+                return
+            except FileExistsError:
+                self._remove_if_stale()
+            if time.time() >= end_time:
+                raise TimeoutError(f"Could not acquire lock {self.path}")
+            time.sleep(0.05)
+
+    def release(self):
+        """Release the lock if it is held."""
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _owner_pid(self) -> int | None:
+        """Get the id of the process holding the lock, if written yet"""
+        try:
+            return int(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _remove_if_stale(self):
+        try:
+            age = time.time() - os.path.getmtime(self.path)
+        except FileNotFoundError:
+            return
+        if age <= self.stale_after:
+            return
+        owner = self._owner_pid()
+        if owner is not None and _process_alive(owner):
+            return
+        logger.warning(f"Removing stale lock file {self.path}")
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class JsonCacheFile:
+    """A small JSON document on disk shared between processes.
+
+    Reads never block. Updates happen under a FileLock and are written
+    atomically, so readers only ever see a complete document.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = FileLock(f"{self.path}.lock")
+
+    def read(self) -> dict:
+        """Return the cached document, or an empty dict if unavailable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @contextmanager
+    def update(self):
+        """Lock the file and yield its contents for in-place modification.
+
+        The yielded dict is written back when the block exits cleanly.
+        """
+        with self.lock:
+            data = self.read()
+            yield data
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.cache_file import FileLock
+
+import logging
+logger = logging.getLogger()
+
+CASSETTE_MODES = ("off", "record", "replay", "auto")
+
+# Response headers that are never written to a cassette. Bodies are
+# stored decoded, so the encoding and length headers would be wrong.
+SKIPPED_HEADERS = {
+    "set-cookie",
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+}
+
+# Local servers listen on a new port every run, so any loopback address
+# is recorded and matched as plain "localhost", without the port
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def cassette_mode() -> str:
+    """Get the API_CASSETTE_MODE from the .env, "off" by default"""
+    mode = os.getenv("API_CASSETTE_MODE", "off").lower()
+    if mode not in CASSETTE_MODES:
+        raise ValueError(
+            f"Unsupported API_CASSETTE_MODE: {mode}. "
+            f"Use one of {CASSETTE_MODES}"
+        )
+    return mode
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def _cassette_host(url: str) -> str:
+    """Get the host a URL's responses are recorded under"""
+    parts = urlsplit(url)
+    if parts.hostname in LOOPBACK_HOSTS:
+        return "localhost"
+    return parts.netloc
+
+
+def request_key(
+    method: str,
+    url: str,
+    authenticated: bool = False,
+    **kwargs
+) -> str:
+    """Normalize a request into a stable cache key.
+
+    Query parameters are sorted and JSON bodies are re-serialized with
+    sorted keys, so equivalent requests always get the same key. Headers
+    and credentials are left out; only whether auth was sent counts.
+    """
+    prepared = requests.Request(
+        method,
+        url,
+        params=kwargs.get("params"),
+        data=kwargs.get("data"),
+        json=kwargs.get("json"),
+    ).prepare()
+
+    scheme, _, path, query, _ = urlsplit(prepared.url)
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    normalized_url = urlunsplit(
+        (scheme, _cassette_host(prepared.url), path, query, "")
+    )
+
+    body = prepared.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if kwargs.get("json") is not None:
+        body = json.dumps(kwargs["json"], sort_keys=True).encode("utf-8")
+
+    digest = hashlib.sha256()
+    for part in (method.upper(), normalized_url, str(authenticated)):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class Cassette:
+    """Recorded API responses for one host, stored as JSON lines.
+
+    Each line holds one request key and the response it got. The whole
+    file is loaded into a dict on first use, so replaying a response is a
+    single lookup with no network involved. Re-recording a request appends
+    a new line, and the last line for a key wins.
+
+    Modes (API_CASSETTE_MODE):
+      - record: Always send requests and save their responses.
+      - replay: Only serve saved responses, failing on unknown requests.
+      - auto: Serve saved responses, recording any that are missing.
+
+    Important:
+      - Request headers and credentials are never stored, and neither
+        are Set-Cookie response headers.
+
+    """
+
+    def __init__(self, path, mode: str):
+        self.path = Path(path)
+        self.mode = mode
+        self.lock = FileLock(f"{self.path}.lock")
+        self._index = None
+        self._index_lock = threading.Lock()
+
+    def request(self, session, method: str, url: str, **kwargs):
+        """Serve a request from the cassette or send and record it"""
+        key = request_key(
+            method,
+            url,
+            authenticated=kwargs.get("auth") is not None,
+            **kwargs
+        )
+        if self.mode != "record":
+            entry = self._load().get(key)
+            if entry is not None:
+                return self._to_response(entry, method, url)
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded response for {method} {url} in "
+                    f"{self.path}. Record it with API_CASSETTE_MODE=auto"
+                )
+
+        response = session.request(method, url, **kwargs)
+        self._save(key, response)
+        return response
+
+    def _load(self) -> dict:
+        with self._index_lock:
+            if self._index is None:
+                self._index = {}
+                if self.path.exists():
+                    with open(self.path, encoding="utf-8") as f:
+                        for line in f:
+                            if line.strip():
+                                entry = json.loads(line)
+                                self._index[entry["key"]] = entry
+                logger.debug(
+                    f"Loaded {len(self._index)} responses from {self.path}"
+                )
+            return self._index
+
+    def _save(self, key: str, response):
+        entry = {
+            "key": key,
+            "status": response.status_code,
+            "reason": response.reason,
+            "url": response.url,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+        }
+        # Keep text bodies readable in the file, e.g. in code review
+        try:
+            entry["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["base64"] = base64.b64encode(response.content).decode()
+        line = json.dumps(entry) + "\n"
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        self._load()[key] = entry
+
+    def _to_response(self, entry: dict, method: str, url: str):
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        if "text" in entry:
+            response._content = entry["text"].encode("utf-8")
+        else:
+            response._content = base64.b64decode(entry["base64"])
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers
+        )
+        response.request = requests.Request(method, url).prepare()
+        return response
+
+
+_cassettes = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(base_url: str) -> Cassette | None:
+    """Get the cassette for an API's base URL, or None when turned off"""
+    mode = cassette_mode()
+    if mode == "off":
+        return None
+    folder = Path(os.getenv("API_CASSETTE_DIR", "tests/cassettes"))
+    name = _cassette_host(base_url).replace(":", "_") or "default"
+    path = folder / f"{name}.jsonl"
+    with _cassettes_lock:
+        cassette = _cassettes.get((path, mode))
+        if cassette is None:
+            cassette = Cassette(path, mode)
+            _cassettes[(path, mode)] = cassette
+        return cassette
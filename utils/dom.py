@@ -4,25 +4,41 @@ import os
 from pathlib import Path
 from functools import wraps
 
+from utils.artifact_store import store_enabled
+from utils.artifacts import get_artifact_writer
+from utils.logging import events
+
 import logging
 logger = logging.getLogger()
 
 def save_dom(driver, filename="page_dump.html"):
     """Save the current DOM from the Selenium driver to a local HTML file.
 
+    Only reading the DOM blocks the caller; the file is written in the
+    background by the ArtifactWriter.
+
     Args:
         driver: The Selenium WebDriver instance.
         filename: The name of the file to save the DOM HTML content as.
 
     """
-    dom = driver.execute_script("return document.documentElement.outerHTML;")
+    with events.timed("artifact_capture", artifact="dom"):
+        dom = driver.execute_script(
+            "return document.documentElement.outerHTML;"
+        )
     file_path = Path(
         os.getenv("LATEST_REPORT_DIR", "unknown_dom")
     ) / "dom" / filename
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(dom)
-    logger.info(f"DOM saved to {file_path}"
+    # DOMs are only archived when the compressed ArtifactStore is in use
+    if store_enabled():
+        get_artifact_writer().write_text(
+            dom, file_path, store_name=f"dom/{filename}"
+        )
+        logger.info(f"DOM queued for saving to {file_path}")
+        return
+
+    get_artifact_writer().write_text(dom, file_path)
+    logger.info(f"DOM queued for saving to {file_path}"
           " (This file will not be available in the timestamped archive)"
     )
 
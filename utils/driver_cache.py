@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import datetime
+import os
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from utils.cache_file import JsonCacheFile
+
+import logging
+logger = logging.getLogger()
+
+DRIVER_MANAGERS = {
+    "chrome": ChromeDriverManager,
+    "firefox": GeckoDriverManager,
+    "edge": EdgeChromiumDriverManager,
+}
+
+# Driver paths resolved in this process, so workers read the file only once
+_resolved_paths = {}
+
+
+def _cache_file() -> JsonCacheFile:
+    """Get the shared file of resolved driver paths in the WDM cache."""
+    cache_dir = os.getenv("WDM_CACHE_DIR", os.path.abspath("drivers_cache"))
+    return JsonCacheFile(Path(cache_dir) / "driver_paths.json")
+
+
+def _is_offline() -> bool:
+    return os.getenv("DRIVER_CACHE_OFFLINE", "false").lower() == "true"
+
+
+def _browser_version(manager) -> str | None:
+    """Read the installed browser version from the OS (no network)."""
+    try:
+        return manager.driver.get_browser_version_from_os()
+    except Exception as e:
+        logger.debug(f"Could not detect browser version: {e}")
+        return None
+
+
+def _entry_matches(entry: dict | None, browser_version: str | None) -> bool:
+    """Check a cached entry still points at a usable, matching binary."""
+    if not entry or not os.path.exists(entry.get("path", "")):
+        return False
+    if browser_version is None:
+        return True
+    return entry.get("browser_version") == browser_version
+
+
+def resolve_driver_paths(browsers: list[str]) -> dict[str, str]:
+    """Resolve each browser's driver binary once for the whole test run.
+
+    Runs in the test launcher before pytest starts. Results are stored in
+    a lock-protected cache file that every xdist worker reads instead of
+    calling webdriver_manager itself.
+
+    With `DRIVER_CACHE_OFFLINE=true`, a cached binary that still exists and
+    matches the installed browser version is reused without any network
+    access. Otherwise webdriver_manager checks for the right version.
+
+    Args:
+        browsers (list[str]): Browser names, e.g. ["chrome", "edge"].
+
+    Returns:
+        dict[str, str]: Browser names mapped to driver binary paths.
+            Browsers that could not be resolved are left out.
+
+    """
+    offline = _is_offline()
+    paths = {}
+    with _cache_file().update() as cache:
+        for browser in browsers:
+            manager = DRIVER_MANAGERS[browser]()
+            browser_version = _browser_version(manager)
+            entry = cache.get(browser)
+
+            if offline and _entry_matches(entry, browser_version):
+                logger.info(f"Using cached {browser} driver (offline mode)")
+                paths[browser] = entry["path"]
+                continue
+
+            try:
+                path = manager.install()
+            except Exception as e:
+                logger.warning(f"Could not resolve {browser} driver: {e}")
+                continue
+
+            cache[browser] = {
+                "path": path,
+                "browser_version": browser_version,
+                "resolved_at": datetime.datetime.now().isoformat(),
+            }
+            paths[browser] = path
+            logger.info(f"Resolved {browser} driver: {path}")
+
+    _resolved_paths.update(paths)
+    return paths
+
+
+def get_driver_path(browser: str) -> str:
+    """Get the driver binary path for a browser.
+
+    Uses the path resolved by the test launcher when available, and only
+    falls back to webdriver_manager if the cache is missing or stale.
+    """
+    path = _resolved_paths.get(browser)
+    if path and os.path.exists(path):
+        return path
+
+    entry = _cache_file().read().get(browser)
+    if entry and os.path.exists(entry.get("path", "")):
+        _resolved_paths[browser] = entry["path"]
+        return entry["path"]
+
+    logger.warning(
+        f"No cached {browser} driver found, resolving with webdriver_manager"
+    )
+    paths = resolve_driver_paths([browser])
+    if browser not in paths:
+        raise RuntimeError(f"Unable to resolve a driver for {browser}")
+    return paths[browser]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import re
+import statistics
+from pathlib import Path
+
+from xdist.scheduler import LoadScheduling
+
+from utils.cache_file import JsonCacheFile
+
+import logging
+logger = logging.getLogger()
+
+# Persists across runs, unlike reports/latest
+HISTORY_FOLDER = Path("reports") / "history"
+
+# Weight of the newest run when updating a test's recorded duration
+SMOOTHING = 0.5
+
+# Suffix xdist's loadgroup mode appends to node ids, e.g. "@chrome-0"
+GROUP_SUFFIX_PATTERN = re.compile(r"@[\w-]+$")
+
+
+def scheduling_enabled() -> bool:
+    """Check whether parallel runs should be ordered by past durations"""
+    return os.getenv("DURATION_SCHEDULING", "true").lower() == "true"
+
+
+def browser_affinity() -> bool:
+    """Check whether parallel workers should stick to one browser type"""
+    return os.getenv("BROWSER_AFFINITY", "false").lower() == "true"
+
+
+class DurationHistory:
+    """Per-test durations from previous runs, used to schedule the next one.
+
+    Test node ids include the browser param (e.g. `test_search[chrome]`),
+    so each browser variant of a test is tracked separately. Durations
+    are smoothed across runs so one slow outlier doesn't reorder the
+    whole suite.
+
+    Usage example:
+        history = DurationHistory()
+        items[:] = history.longest_first(items)
+        ...
+        history.record({"tests/test_a.py::test_a[chrome]": 12.3})
+
+    """
+
+    def __init__(self, path=HISTORY_FOLDER / "durations.json"):
+        self.cache = JsonCacheFile(path)
+
+    def record(self, durations: dict[str, float]):
+        """Blend the durations of the run that just finished into history"""
+        if not durations:
+            return
+        with self.cache.update() as history:
+            for nodeid, duration in durations.items():
+                nodeid = GROUP_SUFFIX_PATTERN.sub("", nodeid)
+                previous = history.get(nodeid)
+                if previous is not None:
+                    duration = (
+                        SMOOTHING * duration + (1 - SMOOTHING) * previous
+                    )
+                history[nodeid] = round(duration, 3)
+        logger.debug(f"Recorded durations for {len(durations)} tests")
+
+    def longest_first(self, items: list) -> list:
+        """Order test items so the slowest start first.
+
+        Tests without history are estimated at the median known duration.
+        Without any history the original order is returned unchanged.
+
+        Args:
+            items (list): Pytest items, or anything with a `nodeid`.
+
+        Returns:
+            list: The items, longest expected duration first.
+
+        """
+        history = self.cache.read()
+        if not history:
+            return list(items)
+        default = statistics.median(history.values())
+        # sorted() is stable, so equal estimates keep collection order
+        return sorted(
+            items,
+            key=lambda item: -history.get(item.nodeid, default)
+        )
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """xdist load scheduling that deals tests out one at a time.
+
+    The default load scheduler sends each worker a chunk of consecutive
+    tests up front, so with a longest-first order the first worker would
+    get all the slowest tests. Instead, the slowest tests are dealt
+    round-robin, snaking back so the worker with the slowest test gets
+    the fastest of the second round, and afterwards each worker that
+    frees up takes the next-longest pending test.
+
+    Expects every worker to have ordered its items with
+    `DurationHistory.longest_first`.
+    """
+
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        # Refill one test at a time unless --maxschedchunk says otherwise
+        self.maxschedchunk = config.getoption("maxschedchunk") or 1
+
+    def schedule(self):
+        """Deal out the initial tests, see the class docstring"""
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, e.g. a node was added
+        if self.collection is not None:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+
+        # Two tests each, so workers never wait on the controller
+        for node in self.nodes + self.nodes[::-1]:
+            if not self.pending:
+                break
+            self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import logging
+logger = logging.getLogger()
+
+# Same credentials postman-echo.com accepts on /basic-auth
+BASIC_AUTH_USERNAME = "postman"
+BASIC_AUTH_PASSWORD = "password"
+
+
+def _group_args(pairs: list[tuple[str, str]]) -> dict:
+    """Group query or form pairs like postman-echo: repeats become lists"""
+    args = {}
+    for name, value in pairs:
+        if name not in args:
+            args[name] = value
+        elif isinstance(args[name], list):
+            args[name].append(value)
+        else:
+            args[name] = [args[name], value]
+    return args
+
+
+class EchoRequestHandler(BaseHTTPRequestHandler):
+    """Answer postman-echo's endpoints with the same response shapes"""
+
+    # Keep connections alive so clients can reuse them
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, which would otherwise wait on
+    # the client's delayed ACK (~40 ms per request)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """Handle GET /get, /basic-auth and /stream/<count>"""
+        path = urlsplit(self.path).path
+        if path == "/get":
+            self._send_json(200, self._echo())
+        elif path == "/basic-auth":
+            self._basic_auth()
+        elif path.startswith("/stream/") and path[8:].isdigit():
+            self._stream(int(path[8:]))
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {path}"})
+
+    def do_POST(self):
+        """Handle POST /post"""
+        path = urlsplit(self.path).path
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if path == "/post":
+            self._send_json(200, self._echo(body))
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {path}"})
+
+    def log_message(self, format, *args):
+        """Send request logs to the debug log instead of stderr"""
+        logger.debug(f"Echo server: {format % args}")
+
+    def _echo(self, body: bytes | None = None) -> dict:
+        response = {
+            "args": _group_args(
+                parse_qsl(urlsplit(self.path).query, keep_blank_values=True)
+            ),
+            "headers": {
+                name.lower(): value for name, value in self.headers.items()
+            },
+            "url": f"http://{self.headers.get('Host')}{self.path}",
+        }
+        if body is None:
+            return response
+
+        content_type = self.headers.get("Content-Type", "")
+        text = body.decode("utf-8", errors="replace")
+        data, form, parsed_json = text, {}, None
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            data = ""
+            form = _group_args(parse_qsl(text, keep_blank_values=True))
+        elif content_type.startswith("application/json") and text:
+            try:
+                parsed_json = data = json.loads(text)
+            except ValueError:
+                pass
+        response.update({
+            "data": data,
+            "files": {},
+            "form": form,
+            "json": parsed_json,
+        })
+        return response
+
+    def _basic_auth(self):
+        expected = base64.b64encode(
+            f"{BASIC_AUTH_USERNAME}:{BASIC_AUTH_PASSWORD}".encode()
+        ).decode()
+        if self.headers.get("Authorization") == f"Basic {expected}":
+            self._send_json(200, {"authenticated": True})
+        else:
+            self._send_text(401, "Unauthorized")
+
+    def _stream(self, count: int):
+        """Send `count` echo objects as chunked, newline-delimited JSON"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        echo = self._echo()
+        for index in range(count):
+            line = json.dumps({"id": index, **echo}).encode() + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, status: int, data: dict):
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def _send_text(self, status: int, text: str):
+        self._send(status, text.encode(), "text/plain")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class EchoServer:
+    """Local stand-in for postman-echo.com, served on a background thread.
+
+    Lets API clients be tested and load tested without the network.
+
+    Usage example:
+        with EchoServer() as server:
+            api = PostmanEchoAPI(base_url=server.url)
+            api.echo_get({"foo": "bar"})
+
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Create the server. Port 0 picks any free port."""
+        self.httpd = ThreadingHTTPServer((host, port), EchoRequestHandler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Get the base URL to point API clients at"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving requests in the background"""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            name="echo-server",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Echo server listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
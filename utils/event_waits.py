@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.locators import JS_HELPERS, to_js_locator
+
+import logging
+logger = logging.getLogger()
+
+# Selenium's default script timeout. Waits that fit inside it don't need
+# an extra round-trip to raise it.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# Headroom so the page always answers before WebDriver gives up on it
+SCRIPT_TIMEOUT_MARGIN = 2
+
+# Resolves as soon as the element matches the condition, or with
+# {met: false} after the timeout. The MutationObserver reacts to DOM
+# changes instantly; the slow interval catches layout-only changes such
+# as CSS transitions which don't produce mutations.
+WAIT_SCRIPT = JS_HELPERS + """
+var locator = arguments[0];
+var condition = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+
+function check() {
+    var el = __find(locator);
+    if (condition === 'visible') {
+        return __isDisplayed(el) ? {met: true, element: el} : null;
+    }
+    if (condition === 'clickable') {
+        return __isDisplayed(el) && __isEnabled(el)
+            ? {met: true, element: el} : null;
+    }
+    if (condition === 'invisible') {
+        return __isDisplayed(el) ? null : {met: true, element: null};
+    }
+    throw new Error('Unknown wait condition: ' + condition);
+}
+
+var result = check();
+if (result) {
+    done(result);
+    return;
+}
+
+var finished = false;
+var observer, interval, timer;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+function recheck() {
+    var result = check();
+    if (result) { finish(result); }
+}
+observer = new MutationObserver(recheck);
+observer.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+interval = setInterval(recheck, 100);
+timer = setTimeout(function () { finish({met: false}); }, timeoutMs);
+"""
+
+CONDITIONS = ("visible", "clickable", "invisible")
+
+
+class ObserverUnavailable(Exception):
+    """The in-page wait could not run and the caller should fall back."""
+
+
+def wait_for_element(driver, by, value, condition, timeout):
+    """Wait for an element condition inside the page in one round-trip.
+
+    Injects a MutationObserver through `execute_async_script` that resolves
+    as soon as the locator matches the condition.
+
+    Args:
+        driver: The Selenium WebDriver instance.
+        by: Selenium `By` strategy.
+        value: Locator value.
+        condition (str): One of "visible", "clickable" or "invisible".
+        timeout (float): Max time to wait in seconds.
+
+    Returns:
+        tuple[bool, WebElement | None]: Whether the condition was met, and
+            the matching element for "visible" and "clickable" waits.
+
+    Raises:
+        ObserverUnavailable: If the script could not run or was interrupted
+            (e.g. by a navigation), so the caller can use WebDriverWait.
+
+    """
+    if condition not in CONDITIONS:
+        raise ValueError(f"Unknown wait condition: '{condition}'")
+
+    locator = to_js_locator(by, value)
+    script_timeout = timeout + SCRIPT_TIMEOUT_MARGIN
+    previous_timeout = None
+
+    try:
+        # Only pay for changing the script timeout on unusually long waits
+        if script_timeout > DEFAULT_SCRIPT_TIMEOUT:
+            previous_timeout = driver.timeouts.script
+            driver.set_script_timeout(script_timeout)
+
+        result = driver.execute_async_script(
+            WAIT_SCRIPT, locator, condition, int(timeout * 1000)
+        )
+    except WebDriverException as e:
+        logger.debug(f"In-page wait unavailable, falling back: {e}")
+        raise ObserverUnavailable(str(e)) from e
+    finally:
+        if previous_timeout is not None:
+            try:
+                driver.set_script_timeout(previous_timeout)
+            except WebDriverException as e:
+                logger.debug(f"Could not restore script timeout: {e}")
+
+    if not isinstance(result, dict):
+        raise ObserverUnavailable(f"Unexpected wait result: {result!r}")
+    return bool(result.get("met")), result.get("element")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import logging
+logger = logging.getLogger()
+
+# Connection pool and retry configuration from the .env file
+SESSION_REUSE = os.getenv("API_SESSION_REUSE", "true").lower() == "true"
+POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", 10))
+POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", 10))
+RETRY_TOTAL = int(os.getenv("API_RETRY_TOTAL", 0))
+RETRY_BACKOFF = float(os.getenv("API_RETRY_BACKOFF", 0.5))
+RETRY_STATUSES = tuple(
+    int(status)
+    for status in os.getenv("API_RETRY_STATUSES", "502,503,504").split(",")
+    if status.strip()
+)
+# Only idempotent methods are retried unless the .env opts others in,
+# e.g. "GET,POST", as resending a POST can create duplicate data
+RETRY_METHODS = frozenset(
+    method.strip().upper()
+    for method in os.getenv("API_RETRY_METHODS", "").split(",")
+    if method.strip()
+) or Retry.DEFAULT_ALLOWED_METHODS
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    retries: int = RETRY_TOTAL,
+) -> requests.Session:
+    """Create a session with the configured pool sizes and retry policy.
+
+    Args:
+        pool_connections (int): Number of hosts to keep connection pools
+            for.
+        pool_maxsize (int): Max idle connections kept open per host, which
+            also caps how many threads can share a host without opening
+            throwaway connections.
+        retries (int): How often to retry failed connections and the
+            statuses in API_RETRY_STATUSES, with exponential backoff.
+            Read errors and statuses are only retried for the methods in
+            API_RETRY_METHODS.
+
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class SessionRegistry:
+    """Process-wide `requests.Session` per base URL.
+
+    Every API model for the same service shares one session, so TCP and
+    TLS connections opened by one test are kept alive and reused by the
+    next instead of being set up again.
+
+    Important:
+      - Sessions are shared, so per-client state such as credentials must
+        be sent with each request (see `BaseAPI.with_auth`), never set on
+        the session itself.
+      - Each xdist worker is its own process with its own registry.
+
+    Usage example:
+        session = api_sessions.get("https://postman-echo.com")
+        api_sessions.stats()
+        # {"postman-echo.com": {"requests": 12, "new_connections": 1,
+        #   "reused_connections": 11}}
+
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str) -> requests.Session:
+        """Get the shared session for a base URL, creating it on first use"""
+        if not SESSION_REUSE:
+            return create_session()
+        with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None:
+                session = create_session()
+                self._sessions[base_url] = session
+            return session
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Count requests and new versus reused connections per host"""
+        stats = {}
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    host = stats.setdefault(
+                        pool.host,
+                        {"requests": 0, "new_connections": 0}
+                    )
+                    host["requests"] += pool.num_requests
+                    host["new_connections"] += pool.num_connections
+        for host in stats.values():
+            host["reused_connections"] = max(
+                host["requests"] - host["new_connections"], 0
+            )
+        return stats
+
+    def summary(self) -> str:
+        """Describe the connection counters in a single log-friendly line"""
+        return ", ".join(
+            f"{host}: {counts['requests']} requests, "
+            f"{counts['new_connections']} new / "
+            f"{counts['reused_connections']} reused connections"
+            for host, counts in self.stats().items()
+        ) or "no requests"
+
+    def close(self):
+        """Close every shared session and its pooled connections"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Process-wide registry used by BaseAPI and the api_sessions fixture
+api_sessions = SessionRegistry()
+atexit.register(api_sessions.close)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import ast
+import os
+import subprocess
+from pathlib import Path
+
+import logging
+logger = logging.getLogger()
+
+INCREMENTAL_MODES = ("first", "only")
+
+# Where test modules import local code from: the project root for
+# models/ and utils/, and tests/ for the fixtures package
+IMPORT_ROOTS = (Path("."), Path("tests"))
+
+# Changes here can affect every test
+SHARED_TEST_FILES = (Path("tests") / "conftest.py",)
+
+
+def incremental_mode() -> str | None:
+    """Get the INCREMENTAL mode from the .env, or None when turned off"""
+    mode = os.getenv("INCREMENTAL", "").lower()
+    if mode and mode not in INCREMENTAL_MODES:
+        raise ValueError(
+            f"Unsupported INCREMENTAL mode: {mode}. "
+            f"Use one of {INCREMENTAL_MODES}"
+        )
+    return mode or None
+
+
+def changed_files(base: str | None = None) -> set[Path] | None:
+    """List files changed relative to a git ref, plus uncommitted work.
+
+    Args:
+        base (str): Ref to compare against, e.g. "origin/main". Defaults
+            to HEAD, so only uncommitted and untracked changes count.
+
+    Returns:
+        set[Path]: Resolved paths of changed files, or None if git is
+            unavailable, in which case every test should be treated as
+            affected.
+
+    """
+    commands = [
+        ["git", "diff", "--name-only", base or "HEAD"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    try:
+        root = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        output = [
+            subprocess.run(
+                command, capture_output=True, text=True, check=True
+            ).stdout
+            for command in commands
+        ]
+    except (OSError, subprocess.CalledProcessError) as error:
+        logger.warning(f"Could not get changed files from git: {error}")
+        return None
+    return {
+        (Path(root) / line).resolve()
+        for text in output
+        for line in text.splitlines()
+        if line
+    }
+
+
+def _module_paths(module: str) -> list[Path]:
+    """Find the local files a dotted module name could refer to"""
+    relative = Path(*module.split("."))
+    paths = []
+    for root in IMPORT_ROOTS:
+        for candidate in (
+            root / relative.with_suffix(".py"),
+            root / relative / "__init__.py",
+        ):
+            if candidate.exists():
+                paths.append(candidate.resolve())
+    return paths
+
+
+def local_imports(path: Path) -> set[Path]:
+    """Get the local files a module imports directly"""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return set()
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+            # "from models.pages import base_page" imports a module too
+            modules += [f"{node.module}.{alias.name}" for alias in node.names]
+
+    return {path for module in modules for path in _module_paths(module)}
+
+
+def import_closure(path: Path) -> set[Path]:
+    """Get a module and every local file it imports, directly or not"""
+    seen = set()
+    pending = [Path(path).resolve()]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending.extend(local_imports(current) - seen)
+    return seen
+
+
+def affected_test_files(
+    test_files: list[Path],
+    changed: set[Path] | None
+) -> set[Path]:
+    """Find the test files that import any of the changed files.
+
+    Args:
+        test_files (list[Path]): Candidate test modules.
+        changed (set[Path]): Resolved changed files, or None if unknown.
+
+    Returns:
+        set[Path]: Resolved paths of the affected test modules. Every test
+            is affected when the changes are unknown or touch code shared
+            by all tests, such as conftest and the fixtures.
+
+    """
+    test_files = {Path(path).resolve() for path in test_files}
+    if changed is None:
+        return test_files
+
+    shared = set()
+    for path in SHARED_TEST_FILES:
+        if path.exists():
+            shared |= import_closure(path)
+    if shared & changed:
+        logger.info("Shared test setup changed, every test is affected")
+        return test_files
+
+    return {path for path in test_files if import_closure(path) & changed}
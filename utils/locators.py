@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from selenium.webdriver.common.by import By
+
+# JavaScript helpers for finding and inspecting elements inside the page.
+# Prepend to any script that receives locators from `to_js_locator()`.
+JS_HELPERS = """
+function __find(locator) {
+    if (locator.using === 'xpath') {
+        return document.evaluate(
+            locator.value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return document.querySelector(locator.value);
+}
+function __isDisplayed(el) {
+    if (!el || !el.isConnected || el.getClientRects().length === 0) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+        return false;
+    }
+    if (parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function __isEnabled(el) {
+    return !!el && !el.matches(':disabled');
+}
+function __documentId() {
+    // Tags the current document so a navigation (a new document) can be
+    // told apart from the page a cached element was found on
+    if (!window.__pageModelDocumentId) {
+        window.__pageModelDocumentId =
+            Date.now().toString(36) + Math.random().toString(36).slice(2);
+    }
+    return window.__pageModelDocumentId;
+}
+"""
+
+
+def _css_string(value: str) -> str:
+    """Quote a value for use inside a CSS attribute selector"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _xpath_string(value: str) -> str:
+    """Quote a value as an XPath string literal, even if it has quotes"""
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    parts = value.split('"')
+    return "concat(" + ", '\"', ".join(f'"{part}"' for part in parts) + ")"
+
+
+def to_js_locator(by: str, value: str) -> dict:
+    """Convert a Selenium (By, value) locator into one the page can run.
+
+    Every Selenium locator strategy is expressed as either a CSS selector
+    or an XPath so that it can be evaluated by `JS_HELPERS.__find()`.
+
+    Args:
+        by (str): A Selenium `By` strategy.
+        value (str): The locator value.
+
+    Returns:
+        dict: {"using": "css" | "xpath", "value": str}
+
+    Raises:
+        ValueError: If the locator strategy is not supported.
+
+    """
+    if by == By.XPATH:
+        return {"using": "xpath", "value": value}
+    if by == By.CSS_SELECTOR:
+        return {"using": "css", "value": value}
+    if by == By.ID:
+        return {"using": "css", "value": f"[id={_css_string(value)}]"}
+    if by == By.NAME:
+        return {"using": "css", "value": f"[name={_css_string(value)}]"}
+    if by == By.CLASS_NAME:
+        return {"using": "css", "value": f"[class~={_css_string(value)}]"}
+    if by == By.TAG_NAME:
+        return {"using": "css", "value": value}
+    if by == By.LINK_TEXT:
+        return {
+            "using": "xpath",
+            "value": f"//a[normalize-space(.)={_xpath_string(value)}]"
+        }
+    if by == By.PARTIAL_LINK_TEXT:
+        return {
+            "using": "xpath",
+            "value": f"//a[contains(., {_xpath_string(value)})]"
+        }
+    raise ValueError(f"Unsupported locator strategy: '{by}'")
@@ -1,9 +1,19 @@
 
 from __future__ import annotations
 
+import atexit
+import heapq
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
 
 # Define common constants
 LOG_FORMAT = (
@@ -11,6 +21,17 @@ LOG_FORMAT = (
 )
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Name of the log file in each report folder
+LOG_FILENAME = "logs.log"
+
+# Name of the structured event stream in each report folder
+EVENTS_FILENAME = "events.jsonl"
+
+# Matches the start of a record written by LogFormatter(color=False)
+LOG_RECORD_PATTERN = re.compile(
+    r"^\[\w+\]\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]"
+)
+
 LOG_COLORS = {
     'DEBUG': '\033[94m',   # Blue
     'INFO': '\033[92m',    # Green
@@ -62,6 +83,79 @@ def main_logger():
     )
     LogConfigurator(level=LOG_LEVEL).configure()
 
+def worker_log_filename(worker_id: str | None) -> str:
+    """Get the log filename for a pytest-xdist worker, or the main process"""
+    if worker_id is None:
+        return LOG_FILENAME
+    return f"logs.{worker_id}.log"
+
+def _read_log_records(path: Path):
+    """Yield (timestamp, text) for each record in a log file.
+
+    Lines that don't start a new record (e.g. multi-line messages) stay
+    attached to the record before them.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        timestamp, lines = "", []
+        for line in f:
+            match = LOG_RECORD_PATTERN.match(line)
+            if match and lines:
+                yield timestamp, "".join(lines)
+                lines = []
+            if match:
+                timestamp = match.group(1)
+            lines.append(line)
+        if lines:
+            yield timestamp, "".join(lines)
+
+def merge_worker_logs(report_dir):
+    """Merge per-worker log files into the main log file by timestamp.
+
+    Parallel workers each write their own log file so they never contend
+    for the same file. This streams all of them through a k-way merge, so
+    memory use stays flat no matter how large the logs are, and removes the
+    worker files afterwards.
+
+    Args:
+        report_dir: The report folder holding the log files.
+
+    """
+    report_dir = Path(report_dir)
+    main_log = report_dir / LOG_FILENAME
+    worker_logs = sorted(report_dir.glob(worker_log_filename("gw*")))
+    if not worker_logs:
+        return
+
+    # Hold the main process's handlers for this file while it is replaced.
+    # Their streams reopen in append mode on the next record.
+    handlers = [
+        handler for handler in LogConfigurator.file_handlers()
+        if Path(handler.baseFilename) == main_log.resolve()
+    ]
+    for handler in handlers:
+        handler.acquire()
+        if handler.stream is not None:
+            handler.stream.close()
+            handler.stream = None
+
+    try:
+        sources = [main_log] if main_log.exists() else []
+        sources += worker_logs
+        merged_log = report_dir / f"{LOG_FILENAME}.merging"
+        with open(merged_log, "w", encoding="utf-8") as f:
+            records = heapq.merge(
+                *(_read_log_records(path) for path in sources),
+                key=lambda record: record[0]
+            )
+            for _, text in records:
+                f.write(text)
+        os.replace(merged_log, main_log)
+        for path in worker_logs:
+            path.unlink()
+    finally:
+        for handler in handlers:
+            handler.release()
+
 class LogFormatter(logging.Formatter):
     """Custom logging formatter that supports optional colorization.
 
@@ -87,30 +181,54 @@ class LogFormatter(logging.Formatter):
         super().__init__(fmt="%(asctime)s", datefmt=DATE_FORMAT)
         self.color = color
 
+        # Everything except the record's own values is fixed per level,
+        # so the surrounding text is built once per level and reused
+        self._templates = {}
+
+        # Timestamps only have second precision, so the formatted time is
+        # reused until the second changes. Stored as one tuple so threads
+        # never see a mismatched second and string.
+        self._time_cache = (None, "")
+
+    def _template(self, level_name: str) -> tuple[str, str, str, str]:
+        """Build the fixed text around each field for a log level."""
+        if self.color:
+            level_color = self.colors.get(level_name, self.colors['RESET'])
+            time_color = self.colors['TIMESTAMP']
+            file_color = self.colors['RESET']
+            reset = self.colors['RESET']
+        else:
+            level_color = time_color = file_color = reset = ''
+
+        template = (
+            f"{level_color}[{level_name}]{time_color}[",
+            f"]{file_color}[",
+            f"] {level_color}",
+            reset,
+        )
+        self._templates[level_name] = template
+        return template
+
+    def _format_time(self, log) -> str:
+        """Format the record's timestamp, reusing it within one second."""
+        second = int(log.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = self.formatTime(log, self.datefmt)
+            self._time_cache = (second, cached_time)
+        return cached_time
+
     def format(self, log):
         """Format the log record with colors and structured output."""
-        super().format(log)
-    
-        level_color = (
-            self.colors.get(log.levelname, self.colors['RESET'])
-            if self.color else ''
+        before_time, before_file, before_message, reset = (
+            self._templates.get(log.levelname)
+            or self._template(log.levelname)
         )
-        time_color = self.colors['TIMESTAMP'] if self.color else ''
-        file_color = self.colors['RESET'] if self.color else ''
-        reset = self.colors['RESET'] if self.color else ''
-
-        time_string = f"{time_color}[{log.asctime}]"
-        level_string = f"{level_color}[{log.levelname}]"
-        file_line_string = f"{file_color}[{log.filename}:{log.lineno}]"
-        message_string = f"{level_color}{log.getMessage()}"
-
         return (
-            f"{level_string}"
-            f"{time_string}"
-            f"{file_line_string}"
-            f" {message_string}"
-            f"{reset}"
-    )
+            f"{before_time}{self._format_time(log)}"
+            f"{before_file}{log.filename}:{log.lineno}"
+            f"{before_message}{log.getMessage()}{reset}"
+        )
 
 class LogConfigurator:
     """Encapsulates all logging setup for pytest runs.
@@ -119,12 +237,16 @@ class LogConfigurator:
       - Creates console and file handlers.
       - Attaches appropriate formatters (with or without color).
       - Manages the root logger configuration.
+      - Optionally moves all handler I/O to a background thread.
 
     Important:
       - Depends on handlers to output logs.
       - Instantiates LogFormatter and assigns it to handlers.
       - Users of this class should call `configure()` to apply logging setup.
       - Handlers are specifically designed to work with LogFormatter.
+      - In queued mode (`LOG_QUEUE=true`), the root logger only gets a
+        QueueHandler. A QueueListener thread feeds the real handlers and is
+        stopped at interpreter exit, which flushes any queued records.
 
     Usage example:
         config = LogConfigurator(level=logging.DEBUG)
@@ -132,9 +254,15 @@ class LogConfigurator:
 
     """
 
-    def __init__(self, level=logging.DEBUG):
+    # The active background listener when running in queued mode
+    _listener = None
+
+    def __init__(self, level=logging.DEBUG, queued=None):
         self.level = level
         self.logger = logging.getLogger()
+        if queued is None:
+            queued = os.getenv("LOG_QUEUE", "false").lower() == "true"
+        self.queued = queued
 
     def _create_console_handler(self):
         """Create a StreamHandler for console output.
@@ -161,15 +289,17 @@ class LogConfigurator:
         """        
         # If we want to keep old logs, we will save a second copy 
         # of the log with a timestamp in its filename
+        # Parallel workers each get their own file, merged after the run
+        filename = worker_log_filename(os.getenv("PYTEST_XDIST_WORKER"))
         if timestamped:
             log_filename = os.path.join(
                 os.environ["TIMESTAMPED_REPORT_DIR"],
-                "logs.log"
+                filename
             )
         else:
             log_filename = os.path.join(
                 os.environ["LATEST_REPORT_DIR"],
-                "logs.log"
+                filename
             )
         
         handler = logging.FileHandler(log_filename)
@@ -179,15 +309,184 @@ class LogConfigurator:
 
     def configure(self):
         """Configure the main logger with all enhancements"""
+        LogConfigurator.stop_listener()
         self.logger.handlers.clear()
         self.logger.setLevel(self.level)
-        self.logger.addHandler(self._create_console_handler())
-        self.logger.addHandler(self._create_file_handler())
 
-        # External packages log management
-        logging.getLogger("WDM").setLevel(logging.WARNING)
+        handlers = [self._create_file_handler()]
+
+        # Parallel workers have no terminal, their logs go to file only
+        if os.getenv("PYTEST_XDIST_WORKER") is None:
+            handlers.insert(0, self._create_console_handler())
 
         # If we want to keep old logs, we will save a second copy 
         # of the log with a timestamp in its filename
         if os.getenv("SAVE_HISTORICAL_REPORTS", "false").lower() == "true":
-            self.logger.addHandler(self._create_file_handler(timestamped=True))
+            handlers.append(self._create_file_handler(timestamped=True))
+
+        if self.queued:
+            self._start_listener(handlers)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        # External packages log management
+        logging.getLogger("WDM").setLevel(logging.WARNING)
+
+    def _start_listener(self, handlers):
+        """Route records through a queue to handlers on a background thread
+
+        The root logger only enqueues records, so logging calls never wait
+        on terminal or disk I/O.
+        """
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        LogConfigurator._listener = listener
+
+    @staticmethod
+    def file_handlers() -> list[logging.FileHandler]:
+        """Get the FileHandlers currently receiving root logger records"""
+        handlers = list(logging.getLogger().handlers)
+        if LogConfigurator._listener is not None:
+            handlers += LogConfigurator._listener.handlers
+        return [h for h in handlers if isinstance(h, logging.FileHandler)]
+
+    @staticmethod
+    def stop_listener():
+        """Flush queued records and stop the background listener, if any"""
+        listener = LogConfigurator._listener
+        if listener is None:
+            return
+        LogConfigurator._listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+# Queued records must reach their handlers even if the run crashes
+atexit.register(LogConfigurator.stop_listener)
+
+class EventStream:
+    """Buffered JSON-lines stream of structured performance events.
+
+    Each event is one JSON object per line carrying the current test
+    context (nodeid, worker, browser param, phase) along with its own
+    fields, typically an event name and a duration in seconds.
+
+    Events are kept in memory and appended to the file in bulk, so emitting
+    one is cheap enough for hot paths. Parallel workers write their own
+    `events.<worker>.jsonl` files, merged by the run script afterwards.
+
+    Only active when `EVENT_LOG=true` in the .env file.
+
+    Usage example:
+        events.set_context(nodeid=item.nodeid, phase="call")
+        with events.timed("page_load", page="WikipediaHomePage"):
+            driver.get(url)
+
+    """
+
+    def __init__(self, buffer_size: int | None = None):
+        self.buffer_size = buffer_size
+        self.context = {}
+        self._enabled = None
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check the .env toggle, read on first use since .env loads late"""
+        if self._enabled is None:
+            self._enabled = (
+                os.getenv("EVENT_LOG", "false").lower() == "true"
+            )
+            self.buffer_size = self.buffer_size or int(
+                os.getenv("EVENT_LOG_BUFFER", 500)
+            )
+            self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return self._enabled
+
+    def set_context(self, **fields):
+        """Update the fields attached to every following event"""
+        self.context.update(fields)
+
+    def emit(self, event: str, duration: float | None = None, **fields):
+        """Record an event, flushing to disk when the buffer is full"""
+        if not self.enabled:
+            return
+        record = {
+            "ts": time.time(),
+            "event": event,
+            "worker": self.worker,
+            **self.context,
+            **fields,
+        }
+        if duration is not None:
+            record["duration"] = round(duration, 6)
+        with self._lock:
+            self._buffer.append(record)
+            full = len(self._buffer) >= self.buffer_size
+        if full:
+            self.flush()
+
+    @contextmanager
+    def timed(self, event: str, **fields):
+        """Emit an event with the duration of the wrapped block"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.emit(event, duration=time.perf_counter() - start, **fields)
+
+    def flush(self):
+        """Append all buffered events to this process's events file"""
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+        if not self.enabled:
+            return
+        report_dir = os.getenv("LATEST_REPORT_DIR")
+        if not buffer or report_dir is None:
+            return
+        filename = EVENTS_FILENAME
+        if self.worker != "main":
+            filename = f"events.{self.worker}.jsonl"
+        lines = "".join(
+            json.dumps(record, default=str) + "\n" for record in buffer
+        )
+        with open(Path(report_dir) / filename, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+def merge_event_streams(report_dir):
+    """Merge per-worker event files into events.jsonl by timestamp"""
+    report_dir = Path(report_dir)
+    main_events = report_dir / EVENTS_FILENAME
+    worker_events = sorted(report_dir.glob("events.gw*.jsonl"))
+    if not worker_events:
+        return
+
+    sources = [main_events] if main_events.exists() else []
+    sources += worker_events
+    files = [open(path, encoding="utf-8") for path in sources]
+    try:
+        merged_events = report_dir / f"{EVENTS_FILENAME}.merging"
+        with open(merged_events, "w", encoding="utf-8") as f:
+            f.writelines(
+                heapq.merge(*files, key=lambda line: json.loads(line)["ts"])
+            )
+    finally:
+        for file in files:
+            file.close()
+    os.replace(merged_events, main_events)
+    for path in worker_events:
+        path.unlink()
+
+# Process-wide event stream, flushed at exit so buffered events aren't lost
+events = EventStream()
+atexit.register(events.flush)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.browser_pool import is_chromium
+
+import logging
+logger = logging.getLogger()
+
+# URL patterns for each BLOCK_RESOURCES preset. "*" matches anything.
+BLOCK_PRESETS = {
+    "images": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif",
+        "*.svg", "*.ico",
+    ],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.m3u8"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*",
+        "*analytics.google.com*", "*hotjar.com*", "*segment.io*",
+        "*connect.facebook.net*", "*clarity.ms*",
+    ],
+    "ads": [
+        "*doubleclick.net*", "*googlesyndication.com*",
+        "*googleadservices.com*", "*adservice.google.*",
+        "*amazon-adsystem.com*", "*adnxs.com*", "*criteo.com*",
+    ],
+}
+
+# Firefox can't block URL patterns through WebDriver, so each preset maps
+# to the closest launch preferences instead
+FIREFOX_PRESET_PREFERENCES = {
+    "images": {"permissions.default.image": 2},
+    "fonts": {"browser.display.use_document_fonts": 0},
+    "media": {"media.autoplay.default": 5},
+    "analytics": {"privacy.trackingprotection.enabled": True},
+    "ads": {"privacy.trackingprotection.enabled": True},
+}
+
+
+def blocked_presets() -> list[str]:
+    """Get the presets named in BLOCK_RESOURCES, e.g. images,fonts"""
+    presets = [
+        name.strip().lower()
+        for name in os.getenv("BLOCK_RESOURCES", "").split(",")
+        if name.strip()
+    ]
+    unknown = set(presets) - set(BLOCK_PRESETS)
+    if unknown:
+        raise ValueError(
+            f"Unsupported BLOCK_RESOURCES presets: {sorted(unknown)}. "
+            f"Use any of {list(BLOCK_PRESETS)}"
+        )
+    return presets
+
+
+def global_blocklist() -> list[str]:
+    """Get every URL pattern blocked for all pages by the .env"""
+    patterns = [
+        pattern
+        for preset in blocked_presets()
+        for pattern in BLOCK_PRESETS[preset]
+    ]
+    patterns += [
+        pattern.strip()
+        for pattern in os.getenv("BLOCKED_URLS", "").split(",")
+        if pattern.strip()
+    ]
+    return patterns
+
+
+def firefox_preferences() -> dict:
+    """Get the Firefox preferences that match the BLOCK_RESOURCES presets"""
+    preferences = {}
+    for preset in blocked_presets():
+        preferences.update(FIREFOX_PRESET_PREFERENCES[preset])
+    return preferences
+
+
+def apply_blocklist(driver, patterns) -> bool:
+    """Block requests matching the URL patterns in a Chromium browser.
+
+    Replaces whatever list was applied before, so an empty list unblocks
+    everything. Drivers without the Chrome DevTools Protocol (Firefox)
+    are left alone; they rely on `firefox_preferences()` at launch.
+
+    Args:
+        driver: The Selenium WebDriver instance.
+        patterns (list[str]): URL patterns, "*" matches anything.
+
+    Returns:
+        bool: Whether the browser is now blocking exactly these patterns.
+
+    """
+    patterns = list(dict.fromkeys(patterns))
+    # Skip the round-trip when nothing changes, e.g. blocking turned off
+    if (getattr(driver, "_blocked_urls", None) or []) == patterns:
+        return True
+    if not is_chromium(driver):
+        if patterns:
+            logger.debug("URL blocking is only supported on Chrome and Edge")
+        return False
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except WebDriverException as e:
+        logger.warning(f"Could not apply blocked URLs: {e}")
+        return False
+    driver._blocked_urls = patterns
+    logger.debug(f"Blocking {len(patterns)} URL patterns")
+    return True
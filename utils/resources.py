@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from utils.cache_file import JsonCacheFile
+from utils.durations import HISTORY_FOLDER
+
+import logging
+logger = logging.getLogger()
+
+# Used until a browser's memory use has been measured on this machine
+DEFAULT_MEMORY_PER_BROWSER_MB = 500
+
+# Share of the currently available memory the test workers may use
+MEMORY_HEADROOM = 0.85
+
+# Weight of the newest run when updating a browser's memory estimate
+SMOOTHING = 0.5
+
+
+def available_memory_mb() -> float | None:
+    """Get the memory available for new processes, or None if unknown"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if sys.platform == "win32":
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys / 1024 / 1024
+        return None
+
+    try:
+        return (
+            os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+            / 1024 / 1024
+        )
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def process_tree_rss_mb(pid: int) -> float | None:
+    """Sum the resident memory of a process and all of its descendants.
+
+    Only supported where /proc is available (Linux); returns None
+    elsewhere. Browsers share some memory between their processes, so
+    the total slightly overestimates, which is the safe direction.
+    """
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    children = {}
+    for stat_path in proc.glob("[0-9]*/stat"):
+        try:
+            stat = stat_path.read_text()
+        except OSError:
+            continue
+        # The process name may contain spaces, so split after it
+        fields = stat[stat.rfind(")") + 2:].split()
+        children.setdefault(int(fields[1]), []).append(
+            int(stat_path.parent.name)
+        )
+
+    total_kb = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(proc / str(current) / "status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024 if total_kb else None
+
+
+def memory_sampling() -> bool:
+    """Check whether browser memory use should be measured in this run.
+
+    Only parallel workers sample, as the measurements are only used to
+    size parallel runs, and none are needed when MEMORY_PER_BROWSER_MB
+    replaces them.
+    """
+    return (
+        os.getenv("PYTEST_XDIST_WORKER") is not None
+        and not os.getenv("MEMORY_PER_BROWSER_MB")
+    )
+
+
+class BrowserMemory:
+    """Measured memory use per browser type, persisted between runs.
+
+    In parallel runs the driver fixtures sample each driver's process
+    tree after its test (see `memory_sampling()`), and the largest sample
+    per browser is blended into the history when
+    the worker finishes. The test runner uses it to pick a worker count.
+    """
+
+    def __init__(self, path=HISTORY_FOLDER / "browser_memory.json"):
+        self.cache = JsonCacheFile(path)
+        self.samples = {}
+
+    def sample(self, browser: str, driver):
+        """Measure a driver's browser processes and keep the largest use"""
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return
+        rss_mb = process_tree_rss_mb(process.pid)
+        if rss_mb is not None:
+            self.samples[browser] = max(self.samples.get(browser, 0), rss_mb)
+
+    def save(self):
+        """Blend this process's samples into the stored estimates"""
+        if not self.samples:
+            return
+        with self.cache.update() as history:
+            for browser, rss_mb in self.samples.items():
+                previous = history.get(browser)
+                if previous is not None:
+                    rss_mb = SMOOTHING * rss_mb + (1 - SMOOTHING) * previous
+                history[browser] = round(rss_mb)
+        logger.debug(f"Recorded browser memory use: {self.samples}")
+
+    def estimate(self, browser: str) -> float:
+        """Get the expected memory use in MB of one browser instance"""
+        override = os.getenv("MEMORY_PER_BROWSER_MB")
+        if override:
+            return float(override)
+        return self.cache.read().get(browser, DEFAULT_MEMORY_PER_BROWSER_MB)
+
+
+def recommended_workers(browsers: list[str], per_worker: int = 1) -> int:
+    """Pick how many test workers this machine can run at once.
+
+    Limited by CPU cores and by available memory divided by what one
+    worker's browsers are expected to use. MAX_WORKERS in the .env caps
+    the result.
+
+    Args:
+        browsers (list[str]): Browser types enabled for the run.
+        per_worker (int): Browsers one worker may keep open at a time.
+
+    Returns:
+        int: The number of workers, at least 1.
+
+    """
+    workers = os.cpu_count() or 1
+    memory = BrowserMemory()
+    per_browser_mb = max(
+        (memory.estimate(browser) for browser in browsers),
+        default=DEFAULT_MEMORY_PER_BROWSER_MB
+    )
+    worker_mb = per_browser_mb * max(per_worker, 1)
+
+    available_mb = available_memory_mb()
+    if available_mb is not None:
+        memory_limit = int(available_mb * MEMORY_HEADROOM // worker_mb)
+        logger.info(
+            f"{available_mb:.0f} MB available, ~{worker_mb:.0f} MB per "
+            f"worker: memory allows {memory_limit} workers, "
+            f"CPU allows {workers}"
+        )
+        workers = min(workers, memory_limit)
+
+    max_workers = os.getenv("MAX_WORKERS")
+    if max_workers:
+        workers = min(workers, int(max_workers))
+    return max(workers, 1)
+
+
+# Process-wide samples, saved by conftest when the session finishes
+browser_memory = BrowserMemory()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from utils.cache_file import JsonCacheFile
+from utils.durations import GROUP_SUFFIX_PATTERN, HISTORY_FOLDER
+from utils.incremental import import_closure
+
+import logging
+logger = logging.getLogger()
+
+# Marker that opts a test in, e.g. @pytest.mark.result_cache(env=["KEY"])
+MARKER = "result_cache"
+
+
+def result_cache_enabled() -> bool:
+    """Check whether marked tests may be skipped on a cached pass"""
+    return os.getenv("RESULT_CACHE", "false").lower() == "true"
+
+
+def _conftest_chain(path) -> list[Path]:
+    """Get the conftest.py files pytest loads for a test module"""
+    root = Path.cwd().resolve()
+    folder = Path(path).resolve().parent
+    chain = []
+    for parent in (folder, *folder.parents):
+        if (parent / "conftest.py").exists():
+            chain.append(parent / "conftest.py")
+        if parent == root:
+            break
+    return chain
+
+
+class ResultCache:
+    """Remember passing tests by a hash of everything they depend on.
+
+    A test's key covers its node id (including params), the contents of
+    its module and every local module it imports (page and API models,
+    utilities), every conftest.py above it along with what they import
+    (fixtures, hooks), and the values of the environment variables named
+    in its marker. Only hashes are stored, so secrets never end up on disk.
+
+    A marked test whose key matches a pass recorded within
+    RESULT_CACHE_TTL seconds is skipped and reported as cached.
+
+    Usage example:
+        @pytest.mark.result_cache(env=["POSTMAN_USERNAME"])
+        def test_basic_auth(): ...
+
+    """
+
+    def __init__(self, path=HISTORY_FOLDER / "results.json"):
+        self.cache = JsonCacheFile(path)
+        self.ttl = float(os.getenv("RESULT_CACHE_TTL", 86400))
+        self._entries = None
+        self._file_hashes = {}
+        self._closures = {}
+
+    def key(self, nodeid: str, path, env_names=()) -> str:
+        """Hash a test's inputs into its cache key"""
+        digest = hashlib.sha256(GROUP_SUFFIX_PATTERN.sub("", nodeid).encode())
+        modules = set()
+        for module in (path, *_conftest_chain(path)):
+            modules |= self._import_closure(module)
+        for module_path in sorted(modules):
+            digest.update(self._file_hash(module_path).encode())
+        for name in sorted(env_names):
+            digest.update(f"{name}={os.getenv(name)}".encode())
+        return digest.hexdigest()
+
+    def lookup(self, nodeid: str, key: str) -> float | None:
+        """Get when the test last passed with this key, if still fresh"""
+        if self._entries is None:
+            self._entries = self.cache.read()
+        entry = self._entries.get(GROUP_SUFFIX_PATTERN.sub("", nodeid))
+        if (
+            entry is None
+            or entry["key"] != key
+            or time.time() - entry["passed_at"] > self.ttl
+        ):
+            return None
+        return entry["passed_at"]
+
+    def save(self, passed: dict[str, str], failed: set[str]):
+        """Record the keys of tests that passed and forget failed ones.
+
+        Args:
+            passed (dict[str, str]): Cache keys by node id of tests that
+                ran and passed in this session.
+            failed (set[str]): Node ids of cached tests that failed.
+
+        """
+        if not passed and not failed:
+            return
+        now = time.time()
+        with self.cache.update() as entries:
+            for nodeid, key in passed.items():
+                nodeid = GROUP_SUFFIX_PATTERN.sub("", nodeid)
+                entries[nodeid] = {"key": key, "passed_at": now}
+            for nodeid in failed:
+                entries.pop(GROUP_SUFFIX_PATTERN.sub("", nodeid), None)
+        logger.debug(f"Cached results for {len(passed)} passing tests")
+
+    def _import_closure(self, path) -> set[Path]:
+        path = Path(path).resolve()
+        if path not in self._closures:
+            self._closures[path] = import_closure(path)
+        return self._closures[path]
+
+    def _file_hash(self, path) -> str:
+        if path not in self._file_hashes:
+            with open(path, "rb") as f:
+                self._file_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+        return self._file_hashes[path]
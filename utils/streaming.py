@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+
+import logging
+logger = logging.getLogger()
+
+# Bytes read from the network at a time
+CHUNK_SIZE = 64 * 1024
+
+# Largest single line or JSON item buffered before giving up, so a
+# malformed stream can't grow the buffer without limit
+MAX_ITEM_BYTES = 16 * 1024 * 1024
+
+# Anything but the whitespace allowed between JSON tokens
+_NON_WHITESPACE = re.compile(r"[^ \t\r\n]")
+
+# Longest token a decode error can be reported at the start of when the
+# data is merely cut short, e.g. "fals" or "\\u12"
+_LONGEST_PARTIAL_TOKEN = 6
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    """Check whether a decode error may go away once more data arrives"""
+    return (
+        error.msg.startswith("Unterminated string")
+        or error.pos >= len(error.doc) - _LONGEST_PARTIAL_TOKEN
+    )
+
+
+class StreamedResponse:
+    """Read a large response body piece by piece with bounded memory.
+
+    Wraps a `requests.Response` opened with `stream=True`. Instead of
+    loading the whole body like `.json()`, the iterators hand over data as
+    it arrives, so assertions run on the first records while the rest is
+    still downloading, and a bad record fails the test right away.
+
+    Important:
+      - Use it as a context manager (or call `close()`) so the connection
+        is released even when iteration stops early.
+      - Each body can only be iterated once.
+
+    Usage example:
+        with api.stream("GET", "/export") as stream:
+            for record in stream.iter_ndjson():
+                assert record["status"] == "active"
+
+    """
+
+    def __init__(self, response, max_item_bytes: int = MAX_ITEM_BYTES):
+        self.response = response
+        self.max_item_bytes = max_item_bytes
+        self.bytes_read = 0
+
+    @property
+    def status_code(self) -> int:
+        """Get the HTTP status, available before the body is read"""
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        """Get the response headers, available before the body is read"""
+        return self.response.headers
+
+    def raise_for_status(self):
+        """Fail before reading the body if the request was not successful"""
+        self.response.raise_for_status()
+        return self
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE):
+        """Yield the raw body in chunks of bytes as they arrive"""
+        for chunk in self.response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                self.bytes_read += len(chunk)
+                yield chunk
+
+    def iter_lines(self, chunk_size: int = CHUNK_SIZE):
+        """Yield each line of the body as text, without line endings"""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        # Pieces of the unfinished line, joined once its end arrives
+        pending, pending_size = [], 0
+        for chunk in self.iter_chunks(chunk_size):
+            *lines, rest = decoder.decode(chunk).split("\n")
+            if lines:
+                lines[0] = "".join(pending) + lines[0]
+                for line in lines:
+                    yield line.rstrip("\r")
+                pending, pending_size = [], 0
+            pending.append(rest)
+            pending_size += len(rest)
+            self._check_size(pending_size, "line")
+        pending.append(decoder.decode(b"", final=True))
+        last = "".join(pending)
+        if last:
+            yield last.rstrip("\r")
+
+    def iter_ndjson(self, chunk_size: int = CHUNK_SIZE):
+        """Yield each record of a newline-delimited JSON body"""
+        for number, line in enumerate(self.iter_lines(chunk_size), 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(
+                    f"Invalid JSON on line {number}: {error}"
+                ) from error
+
+    def iter_json_array(self, chunk_size: int = CHUNK_SIZE):
+        """Yield each item of a top-level JSON array as it is parsed.
+
+        Only the item being parsed is kept in memory, never the array.
+        The body must be valid JSON, e.g. items separated by exactly one
+        comma; anything else raises `json.JSONDecodeError` as soon as it
+        arrives.
+
+        An item split across chunks is only parsed again once its data
+        has doubled, so large items take linear time overall, at the
+        cost of yielding them up to their own size in data late.
+        """
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        expect = "["  # What may come next: "[", "item", ",", or "end"
+        first = True  # The array may still be empty, i.e. "]" is allowed
+        retry_size = 0
+        chunks = self.iter_chunks(chunk_size)
+
+        while True:
+            chunk = next(chunks, None)
+            final = chunk is None
+            buffer += text_decoder.decode(chunk or b"", final=final)
+            position = 0
+
+            while True:
+                match = _NON_WHITESPACE.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                position = match.start()
+                char = buffer[position]
+
+                if expect == "end":
+                    raise json.JSONDecodeError("Extra data", buffer, position)
+                if expect == "[":
+                    if char != "[":
+                        raise json.JSONDecodeError(
+                            "Response body is not a JSON array",
+                            buffer,
+                            position
+                        )
+                    expect = "item"
+                    position += 1
+                    continue
+                if char == "]" and (expect == "," or first):
+                    expect = "end"
+                    position += 1
+                    continue
+                if expect == ",":
+                    if char != ",":
+                        raise json.JSONDecodeError(
+                            "Expecting ',' delimiter", buffer, position
+                        )
+                    expect = "item"
+                    position += 1
+                    continue
+
+                if char in ",]":
+                    raise json.JSONDecodeError(
+                        "Expecting value", buffer, position
+                    )
+                # Don't re-parse a large unfinished item on every chunk
+                if not final and len(buffer) - position < retry_size:
+                    break
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as error:
+                    if final or not _is_truncated(error):
+                        raise
+                    retry_size = 2 * (len(buffer) - position)
+                    break
+                # A number at the very end may continue in the next chunk,
+                # e.g. "12" as "123" or "1." as "1.5"
+                if not final and char not in '[{"' and (
+                    end == len(buffer)
+                    or buffer[end] in ".eE" and end + 2 >= len(buffer)
+                ):
+                    break
+                position = end
+                retry_size = 0
+                expect, first = ",", False
+                yield item
+
+            buffer = buffer[position:]
+            self._check_size(len(buffer), "JSON item")
+            if final:
+                break
+
+        if expect != "end":
+            raise json.JSONDecodeError(
+                "Response body ended inside the JSON array",
+                buffer,
+                len(buffer)
+            )
+
+    def close(self):
+        """Release the connection, even if the body wasn't fully read"""
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check_size(self, size: int, kind: str):
+        if size > self.max_item_bytes:
+            self.close()
+            raise ValueError(
+                f"A single {kind} exceeded {self.max_item_bytes} bytes"
+            )
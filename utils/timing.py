@@ -4,12 +4,16 @@ from __future__ import annotations
 
 # Third-party imports
 import os
+import random
 import time
 
 # Local imports
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils.event_waits import ObserverUnavailable, wait_for_element
+from utils.logging import events
+
 # Logging tools
 import logging
 logger = logging.getLogger()
@@ -17,82 +21,300 @@ logger = logging.getLogger()
 # Default timeout
 DEFAULT_TIMEOUT = int(os.getenv("MAX_WAIT", 10))
 
+# Default engine for element waits (see Timing._wait_for_element)
+WAIT_ENGINES = ("observer", "webdriver")
+DEFAULT_WAIT_ENGINE = os.getenv("WAIT_ENGINE", "observer").lower()
+
+# Default polling strategy for wait_until_true (see POLL_STRATEGIES)
+DEFAULT_POLL_STRATEGY = os.getenv("POLL_STRATEGY", "adaptive").lower()
+
+class FixedPolling:
+    """Polling strategy that waits the same interval between every check"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+
+    def intervals(self):
+        """Yield the delay to sleep before each subsequent check"""
+        while True:
+            yield self.interval
+
+class AdaptivePolling:
+    """Polling strategy that starts fast and backs off exponentially.
+
+    Conditions that are met almost immediately are noticed within
+    milliseconds, while long waits settle at `max_interval` so they
+    don't flood the browser with commands.
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.01,
+        factor: float = 2.0,
+        max_interval: float = 0.5,
+        jitter: float = 0.0
+    ):
+        """Configure the backoff curve.
+
+        Args:
+            initial (float): Delay before the second check, in seconds.
+            factor (float): Multiplier applied to the delay after each check.
+            max_interval (float): Upper bound for the delay.
+            jitter (float): Optional random spread as a fraction of the
+                delay (0.1 = +/-10%) so parallel waits don't poll in sync.
+
+        """
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def intervals(self):
+        """Yield the delay to sleep before each subsequent check"""
+        delay = self.initial
+        while True:
+            if self.jitter:
+                yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            else:
+                yield delay
+            delay = min(delay * self.factor, self.max_interval)
+
+POLL_STRATEGIES = {
+    "fixed": FixedPolling,
+    "adaptive": AdaptivePolling,
+}
+
+class WaitMetrics:
+    """Running totals of how many polls and how much time waits used"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded waits"""
+        self.waits = 0
+        self.polls = 0
+        self.timeouts = 0
+        self.seconds = 0.0
+        self.last = None
+
+    def record(self, polls: int, seconds: float, met: bool):
+        """Record the outcome of a single wait"""
+        self.waits += 1
+        self.polls += polls
+        self.seconds += seconds
+        if not met:
+            self.timeouts += 1
+        self.last = {"polls": polls, "seconds": seconds, "met": met}
+
+    def summary(self) -> str:
+        """Describe the recorded waits in a single log-friendly line"""
+        average = self.polls / self.waits if self.waits else 0
+        return (
+            f"{self.waits} waits, {self.polls} polls "
+            f"({average:.1f} per wait), {self.timeouts} timeouts, "
+            f"{self.seconds:.2f}s waiting"
+        )
+
+def _get_poll_strategy(strategy):
+    """Resolve a strategy name or instance into a strategy instance"""
+    if isinstance(strategy, str):
+        if strategy not in POLL_STRATEGIES:
+            raise ValueError(f"Invalid POLL_STRATEGY: '{strategy}'")
+        return POLL_STRATEGIES[strategy]()
+    return strategy
+
 class Timing:
     """Utility class for handling timing actions"""
 
+    # Strategy used by wait_until_true when a call doesn't specify one
+    poll_strategy = _get_poll_strategy(DEFAULT_POLL_STRATEGY)
+
+    # Poll counts for every wait_until_true call in this process
+    metrics = WaitMetrics()
+
+    @staticmethod
+    def set_poll_strategy(strategy):
+        """Change the default polling strategy for all future waits.
+
+        Args:
+            strategy: A name from POLL_STRATEGIES or a strategy instance.
+
+        """
+        Timing.poll_strategy = _get_poll_strategy(strategy)
+
     @staticmethod
-    def wait_until_visible(driver, by, value, timeout=DEFAULT_TIMEOUT):
+    def wait_until_visible(
+        driver,
+        by,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        engine=None
+    ):
         """Wait for element to be visible"""
-        try:
-            return WebDriverWait(driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
-        except Exception as e:
-            message = (
-                f"Element located by ({by}, {value}) was "
-                f"not visible after {timeout} seconds: {e}"
-            )
-            logger.error(message)
-            raise TimeoutError(message) from e
+        return Timing._wait_for_element(
+            driver, by, value, timeout, engine,
+            condition="visible",
+            expected_condition=EC.visibility_of_element_located
+        )
 
     @staticmethod
-    def wait_until_clickable(driver, by, value, timeout=DEFAULT_TIMEOUT):
+    def wait_until_clickable(
+        driver,
+        by,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        engine=None
+    ):
         """Wait for element to be clickable"""
-        try:
-            return WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
-        except Exception as e:
-            message = (
-                f"Element located by ({by}, {value}) was "
-                f"not clickable after {timeout} seconds: {e}"
-            )
-            logger.error(message)
-            raise TimeoutError(message) from e
+        return Timing._wait_for_element(
+            driver, by, value, timeout, engine,
+            condition="clickable",
+            expected_condition=EC.element_to_be_clickable
+        )
 
     @staticmethod
-    def wait_until_invisible(driver, by, value, timeout=DEFAULT_TIMEOUT):
+    def wait_until_invisible(
+        driver,
+        by,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        engine=None
+    ):
         """Wait for element to be invisible"""
+        return Timing._wait_for_element(
+            driver, by, value, timeout, engine,
+            condition="invisible",
+            expected_condition=EC.invisibility_of_element_located
+        )
+
+    @staticmethod
+    def _wait_for_element(
+        driver,
+        by,
+        value,
+        timeout,
+        engine,
+        condition,
+        expected_condition
+    ):
+        """Wait for an element condition using the selected wait engine.
+
+        The "observer" engine waits inside the page with a single script
+        call. If scripts can't run there, or the page navigates mid-wait,
+        the remaining time is spent in the "webdriver" engine, which polls
+        with WebDriverWait.
+
+        Args:
+            driver: The Selenium WebDriver instance.
+            by: Selenium `By` strategy.
+            value: Locator value.
+            timeout (float): Max time to wait in seconds.
+            engine (str): "observer" or "webdriver". Defaults to WAIT_ENGINE.
+            condition (str): "visible", "clickable" or "invisible".
+            expected_condition (callable): The matching Selenium condition.
+
+        """
+        engine = (engine or DEFAULT_WAIT_ENGINE).lower()
+        if engine not in WAIT_ENGINES:
+            raise ValueError(f"Invalid WAIT_ENGINE: '{engine}'")
+
+        message = (
+            f"Element located by ({by}, {value}) was "
+            f"not {condition} after {timeout} seconds"
+        )
+        start_time = time.time()
+
+        if engine == "observer":
+            try:
+                met, element = wait_for_element(
+                    driver, by, value, condition, timeout
+                )
+            except ObserverUnavailable:
+                engine = "webdriver"
+            else:
+                Timing._emit_wait(condition, start_time, met, engine=engine)
+                if not met:
+                    logger.error(message)
+                    raise TimeoutError(message)
+                return element if condition != "invisible" else True
+
+        remaining = max(timeout - (time.time() - start_time), 0)
         try:
-            return WebDriverWait(driver, timeout).until(
-                EC.invisibility_of_element_located((by, value))
+            result = WebDriverWait(driver, remaining).until(
+                expected_condition((by, value))
             )
         except Exception as e:
-            message = (
-                f"Element located by ({by}, {value}) was "
-                f"not invisible after {timeout} seconds: {e}"
-            )
+            Timing._emit_wait(condition, start_time, False, engine=engine)
+            message = f"{message}: {e}"
             logger.error(message)
             raise TimeoutError(message) from e
-    
+        Timing._emit_wait(condition, start_time, True, engine=engine)
+        return result
+
+    @staticmethod
+    def _emit_wait(kind, start_time, met, **fields):
+        """Add a finished wait to the structured event stream"""
+        events.emit(
+            "wait",
+            duration=time.time() - start_time,
+            kind=kind,
+            met=met,
+            **fields
+        )
+
     @staticmethod
     def wait_until_true(
         condition,
         timeout=DEFAULT_TIMEOUT,
-        interval=0.5,
+        interval=None,
         message=None,
-        on_timeout=None
+        on_timeout=None,
+        strategy=None
     ):
         """Wait for a custom condition to return True.
 
         Args:
             condition (callable): Your check function.
             timeout (float): Max time to wait in seconds.
-            interval (float): Time between checks.
-            message (str): Optional custom error message.
+            interval (float): Fixed time between checks. Overrides strategy.
+            message (str | callable): Optional custom error message, or a
+                function returning one when the wait times out.
             on_timeout (callable): Optional hook to run before raising.
+            strategy: Polling strategy name or instance for this call only.
+                Defaults to Timing.poll_strategy.
 
         """
-        end_time = time.time() + timeout
+        if interval is not None:
+            strategy = FixedPolling(interval)
+        strategy = _get_poll_strategy(strategy or Timing.poll_strategy)
+        delays = strategy.intervals()
+
+        start_time = time.time()
+        end_time = start_time + timeout
+        polls = 0
 
         while time.time() < end_time:
+            polls += 1
             try:
                 # Condition met!
                 if condition():
+                    elapsed = time.time() - start_time
+                    Timing.metrics.record(polls, elapsed, met=True)
+                    Timing._emit_wait(
+                        "wait_until_true", start_time, True, polls=polls
+                    )
+                    logger.debug(
+                        f"Condition met after {polls} polls in {elapsed:.3f}s"
+                    )
                     return
             except Exception as e:
                 logger.debug(f"Wait condition raised an exception: {e}")
-            time.sleep(interval)
+            remaining = end_time - time.time()
+            time.sleep(max(min(next(delays), remaining), 0))
+
+        Timing.metrics.record(polls, time.time() - start_time, met=False)
+        Timing._emit_wait("wait_until_true", start_time, False, polls=polls)
 
         if on_timeout:
             try:
@@ -100,6 +322,8 @@ class Timing:
             except Exception as e:
                 logger.warning(f"on_timeout() raised: {e}")
 
+        if callable(message):
+            message = message()
         final_message = message or (
             f"Condition not met within {timeout} seconds."
         )
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import bisect
+import html
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import logging
+logger = logging.getLogger()
+
+# Off by default: when disabled, drivers are never wrapped at all
+METRICS_ENABLED = os.getenv("WEBDRIVER_METRICS", "false").lower() == "true"
+
+# Upper bounds (in ms) of the latency histogram buckets; the last is open
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Name recorded for commands sent outside of any page model method
+NO_PAGE = "-"
+
+
+class CommandStats:
+    """Latency histogram and payload totals for one kind of command"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def record(self, duration: float, size: int):
+        """Add one command's latency (seconds) and payload size (bytes)"""
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.bytes += size
+        bucket = bisect.bisect_left(BUCKET_BOUNDS_MS, duration * 1000)
+        self.buckets[bucket] += 1
+
+    def merge(self, other: CommandStats):
+        """Add another histogram's counts into this one"""
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.bytes += other.bytes
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate a latency percentile in ms from the histogram.
+
+        Returns the upper bound of the bucket holding the percentile, or
+        the slowest observed latency for the open-ended last bucket.
+        """
+        if not self.count:
+            return None
+        target = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return float(BUCKET_BOUNDS_MS[index])
+                break
+        return self.max * 1000
+
+    def to_list(self) -> list:
+        """Serialize into a compact JSON-friendly list"""
+        return [self.count, self.total, self.max, self.bytes, self.buckets]
+
+    @classmethod
+    def from_list(cls, data: list) -> CommandStats:
+        """Rebuild stats serialized by `to_list()`"""
+        stats = cls()
+        stats.count, stats.total, stats.max, stats.bytes, buckets = data
+        stats.buckets = list(buckets)
+        return stats
+
+
+def _payload_size(value) -> int:
+    """Approximate the number of bytes a command sent or received"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        # Screenshots and page sources are already plain strings
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _current_page(page_class) -> str:
+    """Find the page model whose method issued the current command"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, page_class):
+            return owner.__class__.__name__
+        frame = frame.f_back
+    return NO_PAGE
+
+
+class WebDriverMetrics:
+    """Record the latency and payload size of every WebDriver command.
+
+    `instrument()` wraps a driver's command executor, so each HTTP
+    round-trip to the browser driver is timed and attributed to the
+    running test and to the page model method that issued it.
+
+    Important:
+      - Only drivers passed to `instrument()` are measured, and nothing is
+        wrapped unless WEBDRIVER_METRICS=true, so there is no overhead
+        when disabled.
+      - Per-test results are handed to the report through
+        the report's `user_properties` by conftest, so they survive xdist.
+
+    Usage example:
+        webdriver_metrics.instrument(driver)
+        webdriver_metrics.start_test(item.nodeid)
+        ...
+        results = webdriver_metrics.finish_test()
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._test = None
+        self._results = defaultdict(CommandStats)
+        self._page_class = None
+
+    def instrument(self, driver):
+        """Wrap the driver's command executor to record every command"""
+        executor = driver.command_executor
+        if getattr(executor, "_metrics_wrapped", False):
+            return driver
+        if self._page_class is None:
+            # Imported late, page models import utilities from this package
+            from models.pages.base_page import BasePage
+            self._page_class = BasePage
+
+        execute = executor.execute
+
+        def timed_execute(command, params=None):
+            started = time.perf_counter()
+            response = execute(command, params)
+            duration = time.perf_counter() - started
+            size = _payload_size(params) + _payload_size(
+                response.get("value") if response else None
+            )
+            page = _current_page(self._page_class)
+            self.record(page, command, duration, size)
+            return response
+
+        executor.execute = timed_execute
+        executor._metrics_wrapped = True
+        return driver
+
+    def record(self, page: str, command: str, duration: float, size: int):
+        """Add one command to the running test's results"""
+        if self._test is None:
+            return
+        with self._lock:
+            self._results[(page, command)].record(duration, size)
+
+    def start_test(self, nodeid: str):
+        """Attribute all following commands to the given test"""
+        with self._lock:
+            self._test = nodeid
+            self._results = defaultdict(CommandStats)
+
+    def finish_test(self) -> list:
+        """Stop recording and return the test's serialized results.
+
+        Returns:
+            list: One `[page, command, stats]` entry per page model and
+                command, with stats from `CommandStats.to_list()`.
+
+        """
+        with self._lock:
+            results = [
+                [page, command, stats.to_list()]
+                for (page, command), stats in self._results.items()
+            ]
+            self._test = None
+            self._results = defaultdict(CommandStats)
+        return results
+
+
+class MetricsReport:
+    """Session-wide aggregation of per-test WebDriver command results"""
+
+    def __init__(self):
+        self.by_command = defaultdict(CommandStats)
+        self.by_page = defaultdict(CommandStats)
+        self.by_test = {}
+
+    def add(self, nodeid: str, results: list, duration: float):
+        """Add one test's serialized results and its total duration"""
+        test_total = CommandStats()
+        for page, command, data in results:
+            stats = CommandStats.from_list(data)
+            self.by_command[command].merge(stats)
+            self.by_page[page].merge(stats)
+            test_total.merge(stats)
+        if test_total.count:
+            self.by_test[nodeid] = (test_total, duration)
+
+    def summary(self) -> str:
+        """Describe the totals in a single log-friendly line"""
+        total = CommandStats()
+        for stats in self.by_command.values():
+            total.merge(stats)
+        return (
+            f"{total.count} commands in {total.total:.2f}s across "
+            f"{len(self.by_test)} tests, {total.bytes / 1024:.0f} KiB"
+        )
+
+    def html_tables(self, slowest: int = 10) -> list[str]:
+        """Render the summary tables for the HTML report.
+
+        Node ids and page names are escaped, as parametrize ids can hold
+        any text.
+        """
+        if not self.by_test:
+            return []
+
+        def histogram_rows(groups):
+            rows = []
+            ordered = sorted(groups.items(), key=lambda g: -g[1].total)
+            for name, stats in ordered:
+                p50, p95 = stats.percentile(50), stats.percentile(95)
+                rows.append(
+                    f"<tr><td>{html.escape(name)}</td><td>{stats.count}</td>"
+                    f"<td>{stats.total:.3f}</td>"
+                    f"<td>{stats.total / stats.count * 1000:.1f}</td>"
+                    f"<td>{p50:.0f}</td><td>{p95:.0f}</td>"
+                    f"<td>{stats.max * 1000:.1f}</td>"
+                    f"<td>{stats.bytes / 1024:.1f}</td></tr>"
+                )
+            return "".join(rows)
+
+        header = (
+            "<tr><th>{}</th><th>Count</th><th>Total (s)</th>"
+            "<th>Mean (ms)</th><th>p50 (ms)</th><th>p95 (ms)</th>"
+            "<th>Max (ms)</th><th>Payload (KiB)</th></tr>"
+        )
+        test_rows = []
+        ordered = sorted(self.by_test.items(), key=lambda t: -t[1][0].total)
+        for nodeid, (stats, duration) in ordered[:slowest]:
+            share = stats.total / duration * 100 if duration else 0
+            test_rows.append(
+                f"<tr><td>{html.escape(nodeid)}</td><td>{stats.count}</td>"
+                f"<td>{stats.total:.3f}</td><td>{duration:.3f}</td>"
+                f"<td>{share:.0f}%</td></tr>"
+            )
+
+        return [
+            "<h2>WebDriver commands</h2>"
+            f"<p>{html.escape(self.summary())}</p>",
+            f"<table>{header.format('Command')}"
+            f"{histogram_rows(self.by_command)}</table>",
+            "<h3>By page model</h3>",
+            f"<table>{header.format('Page model')}"
+            f"{histogram_rows(self.by_page)}</table>",
+            f"<h3>Slowest {slowest} tests by WebDriver time</h3>",
+            "<table><tr><th>Test</th><th>Commands</th>"
+            "<th>WebDriver (s)</th><th>Test (s)</th><th>Share</th></tr>"
+            f"{''.join(test_rows)}</table>",
+        ]
+
+
+# Process-wide recorder used by the driver fixtures and conftest
+webdriver_metrics = WebDriverMetrics()